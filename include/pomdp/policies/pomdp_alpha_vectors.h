@@ -26,15 +26,30 @@
 #define POMDP_ALPHA_VECTORS_H
 
 
+#include "pomdp.h"
+
 namespace nova {
 
 /*
  *  A structure for POMDP alpha-vector policies within nova.
- *  @param  n       The number of states in the POMDP.
- *  @param  m       The number of actions in the POMDP.
- *  @param  r       The number of alpha vectors.
- *  @param  Gamma   The values of each alpha-vector (r-n array).
- *  @param  pi      The action to take at each alpha-vector (r array).
+ *  @param  n           The number of states in the POMDP.
+ *  @param  m           The number of actions in the POMDP.
+ *  @param  r           The number of alpha vectors.
+ *  @param  Gamma       The values of each alpha-vector (r-n array).
+ *  @param  pi          The action to take at each alpha-vector (r array).
+ *  @param  d_Gamma     Device-side pointer of Gamma. GPU version only.
+ *  @param  d_GammaHalf Device-side pointer of Gamma in half precision (IEEE 754 binary16 values, stored
+ *                      as unsigned short for host compilers). GPU version only.
+ *  @param  d_GammaInt8 Device-side pointer of Gamma quantized to int8, with each row padded with zeros to
+ *                      a multiple of four states (r-ceil(n/4)*4 array). GPU version only.
+ *  @param  d_GammaScale Device-side pointer of the scale of each quantized row of Gamma (r array). GPU version only.
+ *  @param  d_pi        Device-side pointer of pi. GPU version only.
+ *  @param  kBatch      The number of beliefs the device-side batch buffers below can hold. GPU version only.
+ *  @param  d_B         Device-side buffer of a batch of beliefs (kBatch-n array). GPU version only.
+ *  @param  d_Bq        Device-side buffer of a batch of int8 beliefs (kBatch-ceil(n/4)*4 array). GPU version only.
+ *  @param  d_BScale    Device-side buffer of the scale of each quantized belief (kBatch array). GPU version only.
+ *  @param  d_Vb        Device-side buffer of the values of a batch of beliefs (kBatch array). GPU version only.
+ *  @param  d_a         Device-side buffer of the actions of a batch of beliefs (kBatch array). GPU version only.
  */
 typedef struct NovaPOMDPAlphaVectors {
     unsigned int n;
@@ -42,6 +57,19 @@ typedef struct NovaPOMDPAlphaVectors {
     unsigned int r;
     float *Gamma;
     unsigned int *pi;
+
+    float *d_Gamma;
+    unsigned short *d_GammaHalf;
+    signed char *d_GammaInt8;
+    float *d_GammaScale;
+    unsigned int *d_pi;
+
+    unsigned int kBatch;
+    float *d_B;
+    signed char *d_Bq;
+    float *d_BScale;
+    float *d_Vb;
+    unsigned int *d_a;
 } POMDPAlphaVectors;
 
 /**
@@ -56,7 +84,28 @@ extern "C" int pomdp_alpha_vectors_value_and_action(const POMDPAlphaVectors *pol
         const float *b, float &Vb, unsigned int &a);
 
 /**
- *  Free the memory for *only* the policy's internal arrays.
+ *  Compute the value of the belief state which results from a belief update, in one pass. The successor
+ *  belief is scored before it is normalized; only the optimal value is divided by the probability of the
+ *  observation, since this does not change the optimal alpha-vector. The caller's bp holds the successor
+ *  belief, so repeated updates (e.g., when executing the policy) allocate no memory.
+ *  @param  policy  The POMDPAlphaVectors object.
+ *  @param  pomdp   The POMDP object, with the same number of states as the policy.
+ *  @param  b       The current belief state (n array).
+ *  @param  a       The action taken.
+ *  @param  o       The observation made.
+ *  @param  bp      The successor belief state (n array), normalized upon success. This will be modified.
+ *  @param  Vbp     The optimal value of the successor belief state. This will be modified.
+ *  @param  ap      The optimal action of the successor belief state. This will be modified.
+ *  @return Returns zero upon success, NOVA_WARNING_INVALID_BELIEF if the observation is impossible,
+ *          and non-zero otherwise.
+ */
+extern "C" int pomdp_alpha_vectors_value_and_action_after_update(const POMDPAlphaVectors *policy,
+        const POMDP *pomdp, const float *b, unsigned int a, unsigned int o, float *bp,
+        float &Vbp, unsigned int &ap);
+
+/**
+ *  Free the memory for *only* the policy's internal arrays. Any device-side memory must be freed first
+ *  with pomdp_alpha_vectors_uninitialize_gpu; otherwise, nothing is freed and an error is returned.
  *  @param  policy  The resultant set of alpha-vectors. Arrays within will be freed.
  *  @return Returns zero upon success, non-zero otherwise.
  */
@@ -0,0 +1,116 @@
+/**
+ *  The MIT License (MIT)
+ *
+ *  Copyright (c) 2015 Kyle Hollins Wray, University of Massachusetts
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a copy of
+ *  this software and associated documentation files (the "Software"), to deal in
+ *  the Software without restriction, including without limitation the rights to
+ *  use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+ *  the Software, and to permit persons to whom the Software is furnished to do so,
+ *  subject to the following conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included in all
+ *  copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+ *  FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+ *  COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+ *  IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ *  CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+
+#ifndef POMDP_ALPHA_VECTORS_GPU_H
+#define POMDP_ALPHA_VECTORS_GPU_H
+
+
+#include "policies/pomdp_alpha_vectors.h"
+
+namespace nova {
+
+/**
+ *  Initialize CUDA by transferring the alpha-vectors and their actions to the device.
+ *  @param  policy  The POMDPAlphaVectors object. Device-side pointers will be created.
+ *  @return Returns zero upon success, non-zero otherwise.
+ */
+extern "C" int pomdp_alpha_vectors_initialize_gpu(POMDPAlphaVectors *policy);
+
+/**
+ *  Initialize CUDA by transferring the alpha-vectors in half precision, and their actions, to the device.
+ *  This halves the memory read per belief, at the cost of roughly three significant digits in Gamma.
+ *  The dot products are still accumulated in single precision.
+ *  @param  policy  The POMDPAlphaVectors object. Device-side pointers will be created.
+ *  @return Returns zero upon success, non-zero otherwise. Fails if Gamma is out of range for half precision.
+ */
+extern "C" int pomdp_alpha_vectors_initialize_half_gpu(POMDPAlphaVectors *policy);
+
+/**
+ *  Initialize CUDA by transferring the alpha-vectors quantized to int8, and their actions, to the device.
+ *  Each alpha-vector has its own scale, max |Gamma_i| / 127, so every row uses the full int8 range. The
+ *  beliefs are then quantized to int8 on the device, each with its own scale, max_s b(s) / 127, and the
+ *  values are dequantized with both scales. The dot products are computed with four-way int8 instructions
+ *  (when available) and accumulated in int32. This quarters the memory read per belief, at the cost of
+ *  roughly two significant digits in the values.
+ *  @param  policy  The POMDPAlphaVectors object. Device-side pointers will be created.
+ *  @return Returns zero upon success, non-zero otherwise.
+ */
+extern "C" int pomdp_alpha_vectors_initialize_int8_gpu(POMDPAlphaVectors *policy);
+
+/**
+ *  Uninitialize CUDA by freeing the device-side alpha-vectors, their actions, and the batch buffers.
+ *  @param  policy  The POMDPAlphaVectors object. Device-side pointers will be freed.
+ *  @return Returns zero upon success, non-zero otherwise.
+ */
+extern "C" int pomdp_alpha_vectors_uninitialize_gpu(POMDPAlphaVectors *policy);
+
+/**
+ *  Ensure the device-side batch buffers (beliefs, values, and actions) can hold at least k beliefs.
+ *  @param  policy  The POMDPAlphaVectors object. Device-side batch pointers may be (re)created.
+ *  @param  k       The number of belief states.
+ *  @return Returns zero upon success, non-zero otherwise.
+ */
+extern "C" int pomdp_alpha_vectors_reserve_batch_gpu(POMDPAlphaVectors *policy, unsigned int k);
+
+/**
+ *  Free only the device-side batch buffers (beliefs, values, and actions).
+ *  @param  policy  The POMDPAlphaVectors object. Device-side batch pointers will be freed.
+ *  @return Returns zero upon success, non-zero otherwise.
+ */
+extern "C" int pomdp_alpha_vectors_uninitialize_batch_gpu(POMDPAlphaVectors *policy);
+
+/**
+ *  Compute the values and actions of a collection of belief states using the GPU. If the policy was
+ *  initialized in half precision or int8, then those alpha-vectors are used.
+ *  @param  policy      The POMDPAlphaVectors object. It must be initialized on the device. Its batch
+ *                      buffers are (re)allocated if they cannot hold k beliefs, and are kept for later calls.
+ *  @param  numThreads  The number of CUDA threads per block. Use multiples of 32.
+ *  @param  k           The number of belief states.
+ *  @param  B           The belief states (k-n array).
+ *  @param  Vb          The optimal values of the belief states (k array). This will be modified.
+ *  @param  a           The optimal actions of the belief states (k array). This will be modified.
+ *  @return Returns zero upon success, non-zero otherwise.
+ */
+extern "C" int pomdp_alpha_vectors_value_and_action_gpu(POMDPAlphaVectors *policy,
+        unsigned int numThreads, unsigned int k, const float *B, float *Vb, unsigned int *a);
+
+/**
+ *  Sort the alpha-vectors, and their actions, by their best value over a set of witness beliefs
+ *  using a bitonic sort on the GPU. The alpha-vectors most likely to be maximal come first, which
+ *  is useful for pruning. Ties keep their original order. This modifies Gamma and pi on the host.
+ *  @param  policy      The POMDPAlphaVectors object. It must not be initialized on the device.
+ *  @param  numThreads  The number of CUDA threads per block. Use multiples of 32.
+ *  @param  k           The number of witness beliefs.
+ *  @param  W           The witness beliefs (k-n array).
+ *  @return Returns zero upon success, non-zero otherwise.
+ */
+extern "C" int pomdp_alpha_vectors_sort_gpu(POMDPAlphaVectors *policy, unsigned int numThreads,
+        unsigned int k, const float *W);
+
+};
+
+
+#endif // POMDP_ALPHA_VECTORS_GPU_H
+
+
@@ -22,5 +22,5 @@
 
 __all__ = ["nova_mdp", "mdp", "nova_mdp_value_function", "mdp_value_function",
             "nova_pomdp", "pomdp", "nova_pomdp_alpha_vectors", "pomdp_alpha_vectors",
-            "file_loader"]
+            "file_loader", "numba_kernels"]
 
@@ -23,11 +23,34 @@
 import os
 import sys
 import csv
+import uuid
 import numpy as np
 
 sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__))))
 
 
+# The variables of a loaded (PO)MDP which are saved in, and loaded from, a cache file.
+CACHED_VARIABLES = ['n', 'ns', 'm', 'z', 'r', 'rz', 'k', 'gamma', 'horizon', 'Rmin', 'Rmax', 'epsilon',
+                    'S', 'T', 'O', 'R', 'Z', 'B']
+
+
+def array_view(pointer, shape):
+    """ Return a numpy view of a ctypes array, or an empty array if it is NULL or has no elements.
+
+        Parameters:
+            pointer --  The ctypes pointer to the array.
+            shape   --  The shape of the array.
+
+        Returns:
+            The numpy view of the array, which does not copy it.
+    """
+
+    if not pointer or int(np.prod(shape)) == 0:
+        return np.empty((0,) * len(shape), dtype=np.dtype(pointer._type_))
+
+    return np.ctypeslib.as_array(pointer, shape=shape)
+
+
 class FileLoader(object):
     """ Load a (PO)MDP file in the style of Cassandra's format or a raw format.
     
@@ -208,17 +231,71 @@ class FileLoader(object):
             print("Failed to load file '%s'." % (filename))
             raise Exception()
 
-    def load_cassandra(self, filename):
+    def load_cassandra(self, filename, cache=False):
         """ Load a Cassandra-format (PO)MDP file given the filename.
 
             Parameters:
                 filename    --  The name and path of the file to load.
+                cache       --  Optionally save the loaded variables to '<filename>.npz', and load them from
+                                there instead of parsing the file again, until the file is modified.
+                                Default is False.
         """
 
+        cacheFilename = filename + ".npz"
+        if cache and os.path.isfile(cacheFilename) and \
+                os.path.getmtime(cacheFilename) >= os.path.getmtime(filename):
+            self._load_cache(cacheFilename)
+            return
+
         data = self._load_parse(filename)
         pomdp = self._load_extract(filename, data)
         self._load_create(pomdp)
 
+        # Note: The cache only speeds up later loads, so failing to save it must not fail this one.
+        if cache:
+            try:
+                self._save_cache(cacheFilename)
+            except (IOError, OSError) as e:
+                print("Warning: Failed to save the cache file '%s': %s" % (cacheFilename, str(e)))
+
+    def _save_cache(self, cacheFilename):
+        """ Save the loaded variables to a numpy '.npz' file.
+
+            Parameters:
+                cacheFilename   --  The name and path of the cache file to save.
+        """
+
+        variables = {key: getattr(self, key) for key in CACHED_VARIABLES if getattr(self, key) is not None}
+
+        # Write to a temporary file in the same directory, then move it into place, so that concurrent
+        # loads (e.g., batch runs) never read a partially written cache file. Unlike tempfile.mkstemp,
+        # creating it with mode 0666 lets the umask set its permissions, as with open().
+        temporaryFilename = "%s.%s.tmp" % (cacheFilename, uuid.uuid4().hex)
+        fd = os.open(temporaryFilename, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+
+        try:
+            # Note: Saving to a file object prevents numpy from appending another '.npz' to the name.
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, **variables)
+            os.replace(temporaryFilename, cacheFilename)
+        finally:
+            if os.path.exists(temporaryFilename):
+                os.remove(temporaryFilename)
+
+    def _load_cache(self, cacheFilename):
+        """ Load the variables from a numpy '.npz' file, created by _save_cache.
+
+            Parameters:
+                cacheFilename   --  The name and path of the cache file to load.
+        """
+
+        with np.load(cacheFilename) as variables:
+            for key in variables.files:
+                value = variables[key]
+                if value.ndim == 0:
+                    value = value.item()
+                setattr(self, key, value)
+
     def _load_parse(self, filename):
         """ Step 1/1: Load the raw data from a file into an easier to use list.
 
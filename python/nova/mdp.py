@@ -206,14 +206,12 @@ class MDP(nm.NovaMDP):
         result += "horizon: " + str(self.horizon) + "\n"
         result += "gamma:   " + str(self.gamma) + "\n\n"
 
-        result += "S(s, a, s'):\n%s" % (str(np.array([self.S[i] \
-                    for i in range(self.n * self.m * self.ns)]).reshape((self.n, self.m, self.ns)))) + "\n\n"
+        # Note: These are numpy views of the arrays, so nothing is copied element by element.
+        result += "S(s, a, s'):\n%s" % (str(fl.array_view(self.S, (self.n, self.m, self.ns)))) + "\n\n"
 
-        result += "T(s, a, s'):\n%s" % (str(np.array([self.T[i] \
-                    for i in range(self.n * self.m * self.ns)]).reshape((self.n, self.m, self.ns)))) + "\n\n"
+        result += "T(s, a, s'):\n%s" % (str(fl.array_view(self.T, (self.n, self.m, self.ns)))) + "\n\n"
 
-        result += "R(s, a):\n%s" % (str(np.array([self.R[i] \
-                    for i in range(self.n * self.m)]).reshape((self.n, self.m)))) + "\n\n"
+        result += "R(s, a):\n%s" % (str(fl.array_view(self.R, (self.n, self.m)))) + "\n\n"
 
         return result
 
@@ -29,6 +29,7 @@ import time
 
 sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__))))
 import nova_mdp_value_function as nmvf
+import file_loader as fl
 
 
 class MDPValueFunction(nmvf.NovaMDPValueFunction):
@@ -63,14 +64,14 @@ class MDPValueFunction(nmvf.NovaMDPValueFunction):
                 The string of the MDP value function.
         """
 
-        result = "S:\n%s" % (str(np.array([self.S[i] \
-                    for i in range(self.r)]))) + "\n\n"
+        # Note: If r == 0, then every state is relevant, and V and pi are n arrays.
+        k = self.r if self.r > 0 else self.n
 
-        result += "V:\n%s" % (str(np.array([[self.Gamma[i * self.n + s] \
-                    for i in range(self.r)] for s in range(self.n)]))) + "\n\n"
+        result = "S:\n%s" % (str(fl.array_view(self.S, (self.r,)))) + "\n\n"
 
-        result += "pi:\n%s" % (str(np.array([self.pi[i] \
-                    for i in range(self.r)]))) + "\n\n"
+        result += "V:\n%s" % (str(fl.array_view(self.V, (k,)))) + "\n\n"
+
+        result += "pi:\n%s" % (str(fl.array_view(self.pi, (k,)))) + "\n\n"
 
         return result
 
@@ -140,6 +140,17 @@ _nova.pomdp_sigma_cpu.argtypes = (ct.POINTER(NovaPOMDP),
                                   ct.POINTER(ct.c_float))   # sigma
 
 
+# Functions from 'pomdp_alpha_vectors.h' which also require the POMDP.
+_nova.pomdp_alpha_vectors_value_and_action_after_update.argtypes = (ct.POINTER(pav.POMDPAlphaVectors),
+                                        ct.POINTER(NovaPOMDP),
+                                        ct.POINTER(ct.c_float),     # b
+                                        ct.c_uint,                  # a
+                                        ct.c_uint,                  # o
+                                        ct.POINTER(ct.c_float),     # bp
+                                        ct.POINTER(ct.c_float),     # Vbp
+                                        ct.POINTER(ct.c_uint))      # ap
+_nova.pomdp_alpha_vectors_value_and_action_after_update.restype = ct.c_int
+
 # Functions from 'pomdp_model_gpu.h'.
 _nova.pomdp_initialize_successors_gpu.argtypes = tuple([ct.POINTER(NovaPOMDP)])
 _nova.pomdp_uninitialize_successors_gpu.argtypes = tuple([ct.POINTER(NovaPOMDP)])
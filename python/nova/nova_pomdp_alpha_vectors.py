@@ -51,6 +51,17 @@ class NovaPOMDPAlphaVectors(ct.Structure):
                 ("r", ct.c_uint),
                 ("Gamma", ct.POINTER(ct.c_float)),
                 ("pi", ct.POINTER(ct.c_uint)),
+                ("d_Gamma", ct.POINTER(ct.c_float)),
+                ("d_GammaHalf", ct.POINTER(ct.c_ushort)),
+                ("d_GammaInt8", ct.POINTER(ct.c_byte)),
+                ("d_GammaScale", ct.POINTER(ct.c_float)),
+                ("d_pi", ct.POINTER(ct.c_uint)),
+                ("kBatch", ct.c_uint),
+                ("d_B", ct.POINTER(ct.c_float)),
+                ("d_Bq", ct.POINTER(ct.c_byte)),
+                ("d_BScale", ct.POINTER(ct.c_float)),
+                ("d_Vb", ct.POINTER(ct.c_float)),
+                ("d_a", ct.POINTER(ct.c_uint)),
                 ]
 
 
@@ -59,6 +70,23 @@ _nova.pomdp_alpha_vectors_value_and_action.argtypes = (ct.POINTER(NovaPOMDPAlpha
                                         ct.POINTER(ct.c_float),                 # b
                                         ct.POINTER(ct.c_float),                 # Vb
                                         ct.POINTER(ct.c_uint))                  # a
+_nova.pomdp_alpha_vectors_value_and_action.restype = ct.c_int
 _nova.pomdp_alpha_vectors_free.argtypes = tuple([ct.POINTER(NovaPOMDPAlphaVectors)])
 
+# Functions from 'pomdp_alpha_vectors_gpu.h'.
+_nova.pomdp_alpha_vectors_initialize_gpu.argtypes = tuple([ct.POINTER(NovaPOMDPAlphaVectors)])
+_nova.pomdp_alpha_vectors_initialize_half_gpu.argtypes = tuple([ct.POINTER(NovaPOMDPAlphaVectors)])
+_nova.pomdp_alpha_vectors_initialize_int8_gpu.argtypes = tuple([ct.POINTER(NovaPOMDPAlphaVectors)])
+_nova.pomdp_alpha_vectors_uninitialize_gpu.argtypes = tuple([ct.POINTER(NovaPOMDPAlphaVectors)])
+_nova.pomdp_alpha_vectors_value_and_action_gpu.argtypes = (ct.POINTER(NovaPOMDPAlphaVectors),
+                                        ct.c_uint,                              # numThreads
+                                        ct.c_uint,                              # k
+                                        ct.POINTER(ct.c_float),                 # B
+                                        ct.POINTER(ct.c_float),                 # Vb
+                                        ct.POINTER(ct.c_uint))                  # a
+_nova.pomdp_alpha_vectors_sort_gpu.argtypes = (ct.POINTER(NovaPOMDPAlphaVectors),
+                                        ct.c_uint,                              # numThreads
+                                        ct.c_uint,                              # k
+                                        ct.POINTER(ct.c_float))                 # W
+
 
@@ -0,0 +1,72 @@
+""" The MIT License (MIT)
+
+    Copyright (c) 2015 Kyle Hollins Wray, University of Massachusetts
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of
+    this software and associated documentation files (the "Software"), to deal in
+    the Software without restriction, including without limitation the rights to
+    use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+    the Software, and to permit persons to whom the Software is furnished to do so,
+    subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+    FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+    COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+    IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+    CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import numpy as np
+
+# Numba is optional. Without it, the kernels below run as plain (slow) Python.
+try:
+    from numba import njit, prange
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda f: f
+    prange = range
+
+
+@njit(parallel=True, fastmath=True)
+def best_action_value(Gamma, pi, B):
+    """ Compute the optimal value and action at each belief, with beliefs evaluated in parallel.
+
+        Parameters:
+            Gamma   --  A numpy array for the alpha-vectors (r-n array).
+            pi      --  A numpy array for the action of each alpha-vector (r array).
+            B       --  A numpy array for the beliefs (k-n array).
+
+        Returns:
+            V   --  The optimal values at the beliefs (k array).
+            a   --  The optimal actions at the beliefs (k array).
+    """
+
+    k = B.shape[0]
+    r = Gamma.shape[0]
+    n = Gamma.shape[1]
+
+    V = np.empty(k, dtype=np.float32)
+    a = np.zeros(k, dtype=np.uint32)
+
+    for i in prange(k):
+        # Note: This matches FLT_MIN used by the nova library, as does the tie-breaking rule.
+        Vb = np.float32(-1e+35)
+        ab = 0
+
+        for j in range(r):
+            value = np.float32(0.0)
+            for s in range(n):
+                value += Gamma[j, s] * B[i, s]
+
+            if Vb < value:
+                Vb = value
+                ab = pi[j]
+
+        V[i] = Vb
+        a[i] = ab
+
+    return V, a
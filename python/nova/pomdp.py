@@ -37,6 +37,10 @@ import pomdp_alpha_vectors as pav
 csv.field_size_limit(sys.maxsize)
 
 
+# The value of NOVA_WARNING_INVALID_BELIEF in 'error_codes.h': An observation is impossible.
+NOVA_WARNING_INVALID_BELIEF = 9
+
+
 class POMDP(npm.NovaPOMDP):
     """ A Partially Observable Markov Decision Process (POMDP) object that can load, solve, and save.
 
@@ -72,7 +76,7 @@ class POMDP(npm.NovaPOMDP):
         self.Rmax = None
         self.epsilon = 0.01
 
-    def load(self, filename, filetype='cassandra', scalarize=lambda x: x[0]):
+    def load(self, filename, filetype='cassandra', scalarize=lambda x: x[0], cache=False):
         """ Load a POMDP file given the filename and optionally the file type.
 
             Parameters:
@@ -80,12 +84,14 @@ class POMDP(npm.NovaPOMDP):
                 filetype    --  Either 'cassandra' or 'raw'. Default is 'cassandra'.
                 scalarize   --  Optionally define a scalarization function. Only used for 'raw' files.
                                 Default returns the first reward.
+                cache       --  Optionally cache the parsed file as '<filename>.npz' for later loads. Only
+                                used for 'cassandra' files. Default is False.
         """
 
         fileLoader = fl.FileLoader()
 
         if filetype == 'cassandra':
-            fileLoader.load_cassandra(filename)
+            fileLoader.load_cassandra(filename, cache)
         elif filetype == 'raw':
             fileLoader.load_raw_pomdp(filename, scalarize)
         else:
@@ -113,12 +119,13 @@ class POMDP(npm.NovaPOMDP):
         array_type_rrz_int = ct.c_int * (self.r * self.rz)
         array_type_rrz_float = ct.c_float * (self.r * self.rz)
 
-        self.S = array_type_nmns_int(*fileLoader.S.flatten())
-        self.T = array_type_nmns_float(*fileLoader.T.flatten())
-        self.O = array_type_mnz_float(*fileLoader.O.flatten())
-        self.R = array_type_nm_float(*fileLoader.R.flatten())
-        self.Z = array_type_rrz_int(*fileLoader.Z.flatten())
-        self.B = array_type_rrz_float(*fileLoader.B.flatten())
+        # Note: Each array is copied at once from a contiguous numpy array of the matching C type.
+        self.S = array_type_nmns_int.from_buffer_copy(np.ascontiguousarray(fileLoader.S, dtype=np.int32))
+        self.T = array_type_nmns_float.from_buffer_copy(np.ascontiguousarray(fileLoader.T, dtype=np.float32))
+        self.O = array_type_mnz_float.from_buffer_copy(np.ascontiguousarray(fileLoader.O, dtype=np.float32))
+        self.R = array_type_nm_float.from_buffer_copy(np.ascontiguousarray(fileLoader.R, dtype=np.float32))
+        self.Z = array_type_rrz_int.from_buffer_copy(np.ascontiguousarray(fileLoader.Z, dtype=np.int32))
+        self.B = array_type_rrz_float.from_buffer_copy(np.ascontiguousarray(fileLoader.B, dtype=np.float32))
 
     def expand(self, method='random', numBeliefsToAdd=1000, Gamma=None):
         """ Expand the belief points by, for example, PBVI's original method, PEMA, or Perseus' random method.
@@ -308,6 +315,53 @@ class POMDP(npm.NovaPOMDP):
 
         return policy, timing
 
+    def value_and_action_after_update(self, policy, b, a, o, bp=None):
+        """ Compute the successor belief, and its optimal value and action, after taking an action and making an observation.
+
+            The belief update and the evaluation of the alpha-vectors are done in one pass by nova,
+            which scores the successor belief before normalizing it.
+
+            Parameters:
+                policy  --  The POMDPAlphaVectors policy.
+                b       --  A numpy array for the current belief (n array).
+                a       --  The action taken.
+                o       --  The observation made.
+                bp      --  Optionally, a numpy float32 array (n array) which will hold the successor
+                            belief, e.g., to reuse two arrays over many updates. Otherwise, one is created.
+
+            Returns:
+                bp  --  The successor belief (n array).
+                V   --  The optimal value at the successor belief.
+                ap  --  The optimal action at the successor belief.
+        """
+
+        b = np.ascontiguousarray(b, dtype=np.float32)
+        if b.size != self.n:
+            print("Failed to update the belief. The belief must have %i states." % (self.n))
+            raise Exception()
+
+        if bp is None:
+            bp = np.empty(self.n, dtype=np.float32)
+        elif (not isinstance(bp, np.ndarray) or bp.dtype != np.float32 or bp.size != self.n or
+                not bp.flags['C_CONTIGUOUS'] or not bp.flags['WRITEABLE']):
+            print("Failed to update the belief. The successor belief must be a writeable, contiguous float32 array with %i states." % (self.n))
+            raise Exception()
+
+        Vbp = ct.c_float(0.0)
+        ap = ct.c_uint(0)
+
+        result = npm._nova.pomdp_alpha_vectors_value_and_action_after_update(policy, self,
+                                b.ctypes.data_as(ct.POINTER(ct.c_float)), int(a), int(o),
+                                bp.ctypes.data_as(ct.POINTER(ct.c_float)), ct.byref(Vbp), ct.byref(ap))
+        if result == NOVA_WARNING_INVALID_BELIEF:
+            print("Failed to update the belief. Observation %i is impossible after action %i." % (o, a))
+            raise Exception()
+        elif result != 0:
+            print("Failed to compute the optimal value and action after the belief update.")
+            raise Exception()
+
+        return bp, Vbp.value, ap.value
+
     def __str__(self):
         """ Return the string of the POMDP values akin to the raw file format.
 
@@ -324,23 +378,18 @@ class POMDP(npm.NovaPOMDP):
         result += "horizon: " + str(self.horizon) + "\n"
         result += "gamma:   " + str(self.gamma) + "\n"
 
-        result += "S(s, a, s'):\n%s" % (str(np.array([self.S[i] \
-                    for i in range(self.n * self.m * self.ns)]).reshape((self.n, self.m, self.ns)))) + "\n\n"
+        # Note: These are numpy views of the arrays, so nothing is copied element by element.
+        result += "S(s, a, s'):\n%s" % (str(fl.array_view(self.S, (self.n, self.m, self.ns)))) + "\n\n"
 
-        result += "T(s, a, s'):\n%s" % (str(np.array([self.T[i] \
-                    for i in range(self.n * self.m * self.ns)]).reshape((self.n, self.m, self.ns)))) + "\n\n"
+        result += "T(s, a, s'):\n%s" % (str(fl.array_view(self.T, (self.n, self.m, self.ns)))) + "\n\n"
 
-        result += "O(a, s', o):\n%s" % (str(np.array([self.O[i] \
-                    for i in range(self.m * self.n * self.z)]).reshape((self.m, self.n, self.z)))) + "\n\n"
+        result += "O(a, s', o):\n%s" % (str(fl.array_view(self.O, (self.m, self.n, self.z)))) + "\n\n"
 
-        result += "R(s, a):\n%s" % (str(np.array([self.R[i] \
-                    for i in range(self.n * self.m)]).reshape((self.n, self.m)))) + "\n\n"
+        result += "R(s, a):\n%s" % (str(fl.array_view(self.R, (self.n, self.m)))) + "\n\n"
 
-        result += "Z(i, s):\n%s" % (str(np.array([self.Z[i] \
-                    for i in range(self.r * self.rz)]).reshape((self.r, self.rz)))) + "\n\n"
+        result += "Z(i, s):\n%s" % (str(fl.array_view(self.Z, (self.r, self.rz)))) + "\n\n"
 
-        result += "B(i, s):\n%s" % (str(np.array([self.B[i] \
-                    for i in range(self.r * self.rz)]).reshape((self.r, self.rz)))) + "\n\n"
+        result += "B(i, s):\n%s" % (str(fl.array_view(self.B, (self.r, self.rz)))) + "\n\n"
 
         return result
 
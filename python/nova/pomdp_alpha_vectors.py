@@ -31,6 +31,10 @@ sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__))))
 import nova_pomdp_alpha_vectors as npav
 
 
+# The value of a belief when no alpha-vector is better, as in 'constants.h'.
+NOVA_FLT_MIN = -1e35
+
+
 class POMDPAlphaVectors(npav.NovaPOMDPAlphaVectors):
     """ The alpha-vector representation of a POMDP policy.
 
@@ -46,10 +50,27 @@ class POMDPAlphaVectors(npav.NovaPOMDPAlphaVectors):
         self.r = 0
         self.Gamma = ct.POINTER(ct.c_float)()
         self.pi = ct.POINTER(ct.c_uint)()
+        self.d_Gamma = ct.POINTER(ct.c_float)()
+        self.d_GammaHalf = ct.POINTER(ct.c_ushort)()
+        self.d_GammaInt8 = ct.POINTER(ct.c_byte)()
+        self.d_GammaScale = ct.POINTER(ct.c_float)()
+        self.d_pi = ct.POINTER(ct.c_uint)()
+        self.kBatch = 0
+        self.d_B = ct.POINTER(ct.c_float)()
+        self.d_Bq = ct.POINTER(ct.c_byte)()
+        self.d_BScale = ct.POINTER(ct.c_float)()
+        self.d_Vb = ct.POINTER(ct.c_float)()
+        self.d_a = ct.POINTER(ct.c_uint)()
 
     def __del__(self):
         """ Free the memory of the policy when this object is deleted. """
 
+        if self._is_initialized_gpu():
+            result = npav._nova.pomdp_alpha_vectors_uninitialize_gpu(self)
+            if result != 0:
+                print("Failed to free the device-side alpha vectors.")
+                raise Exception()
+
         result = npav._nova.pomdp_alpha_vectors_free(self)
         if result != 0:
             print("Failed to free the alpha vectors.")
@@ -62,11 +83,9 @@ class POMDPAlphaVectors(npav.NovaPOMDPAlphaVectors):
                 The string of the POMDP alpha-vectors.
         """
 
-        result = "Gamma:\n%s" % (str(np.array([[self.Gamma[i * self.n + s] \
-                    for i in range(self.r)] for s in range(self.n)]))) + "\n\n"
+        result = "Gamma:\n%s" % (str(self._gamma_array().T)) + "\n\n"
 
-        result += "pi:\n%s" % (str(np.array([self.pi[i] \
-                    for i in range(self.r)]))) + "\n\n"
+        result += "pi:\n%s" % (str(self._pi_array())) + "\n\n"
 
         return result
 
@@ -81,19 +100,194 @@ class POMDPAlphaVectors(npav.NovaPOMDPAlphaVectors):
                 a   --  The optimal action at this belief.
         """
 
-        array_type_n_float = ct.c_float * (self.n)
-        belief = array_type_n_float(*b)
+        b = np.asarray(b)
+        if b.size != self.n:
+            print("Failed to compute the optimal value and action. The belief must have %i states." % (self.n))
+            raise Exception()
+
+        # Contiguous float beliefs are passed to nova directly; anything else is converted once.
+        # Note: The belief and results are local to each call, since ctypes releases the GIL during
+        # the call, and so two threads may evaluate the policy at the same time.
+        b = np.ascontiguousarray(b, dtype=np.float32)
 
         Vb = ct.c_float(0.0)
         a = ct.c_uint(0)
 
-        result = npav._nova.pomdp_alpha_vectors_value_and_action(self, belief, ct.byref(Vb), ct.byref(a))
+        result = npav._nova.pomdp_alpha_vectors_value_and_action(self, b.ctypes.data_as(ct.POINTER(ct.c_float)),
+                                                                ct.byref(Vb), ct.byref(a))
         if result != 0:
             print("Failed to compute the optimal value and action.")
             raise Exception()
 
-        Vb = Vb.value
-        a = a.value
+        return Vb.value, a.value
+
+    def values_and_actions(self, B, process='cpu', numThreads=1024, precision='single'):
+        """ Compute the optimal values and actions at a collection of belief states.
+
+            This evaluates all beliefs against all alpha-vectors at once: with a single matrix
+            product on the CPU, or with a single batched kernel on the GPU. On the GPU, the
+            alpha-vectors are transferred once and remain on the device until this object is deleted.
+            The CPU path may be called from several threads at once. The GPU path may not, since it
+            reuses the device-side batch buffers of this policy.
+
+            Parameters:
+                B           --  A numpy array for the beliefs (k-n array), or a single belief (n array).
+                process     --  Use the 'cpu' or 'gpu'. If 'gpu' fails, it tries 'cpu'. Default is 'cpu'.
+                numThreads  --  The number of CUDA threads to execute (multiple of 32). Default is 1024.
+                precision   --  The precision of the alpha-vectors on the GPU: 'single', 'half', or 'int8'.
+                                Half values are accumulated in single precision. For 'int8', each belief
+                                is quantized too, with its own scale max_s b(s) / 127, and values are
+                                accumulated in int32. Default is 'single'.
+
+            Returns:
+                V   --  The optimal values at these beliefs (k array, or a float for one belief).
+                a   --  The optimal actions at these beliefs (k array, or an int for one belief).
+        """
+
+        B = np.asarray(B, dtype=np.float32)
+        if B.ndim == 0 or B.shape[-1] != self.n:
+            print("Failed to compute the values and actions. The beliefs must have %i states." % (self.n))
+            raise Exception()
+
+        if precision not in ['single', 'half', 'int8']:
+            print("Failed to compute the values and actions. Precision '%s' is not defined." % (precision))
+            raise Exception()
+
+        # Without any alpha-vectors, every belief has the same value and action as in value_and_action.
+        if self.r == 0:
+            V = np.full(B.shape[:-1], NOVA_FLT_MIN, dtype=np.float32)
+            a = np.zeros(B.shape[:-1], dtype=np.uint32)
+            if B.ndim == 1:
+                return V[()], a[()]
+            return V, a
+
+        if process == 'gpu':
+            # Only one precision of the alpha-vectors is kept on the device at a time.
+            result = 0
+            if ((precision == 'single' and not self.d_Gamma) or (precision == 'half' and not self.d_GammaHalf) or
+                    (precision == 'int8' and not self.d_GammaInt8)):
+                if self._is_initialized_gpu():
+                    npav._nova.pomdp_alpha_vectors_uninitialize_gpu(self)
+
+                if precision == 'single':
+                    result = npav._nova.pomdp_alpha_vectors_initialize_gpu(self)
+                elif precision == 'half':
+                    result = npav._nova.pomdp_alpha_vectors_initialize_half_gpu(self)
+                else:
+                    result = npav._nova.pomdp_alpha_vectors_initialize_int8_gpu(self)
+
+                if result != 0:
+                    npav._nova.pomdp_alpha_vectors_uninitialize_gpu(self)
+
+            if result == 0:
+                Bk = np.ascontiguousarray(B.reshape((-1, self.n)))
+                k = Bk.shape[0]
+
+                V = np.empty(k, dtype=np.float32)
+                a = np.empty(k, dtype=np.uint32)
+
+                result = npav._nova.pomdp_alpha_vectors_value_and_action_gpu(self, int(numThreads), int(k),
+                                Bk.ctypes.data_as(ct.POINTER(ct.c_float)),
+                                V.ctypes.data_as(ct.POINTER(ct.c_float)),
+                                a.ctypes.data_as(ct.POINTER(ct.c_uint)))
+
+            if result == 0:
+                if B.ndim == 1:
+                    return V[0], a[0]
+                return V.reshape(B.shape[:-1]), a.reshape(B.shape[:-1])
+
+            print("Failed to compute the values and actions with the 'nova' library's GPU. Trying the CPU.")
+
+        GammaT = self._gamma_transposed_array()
+
+        # Note: The scores are local to each call, since np.matmul also releases the GIL.
+        scores = np.matmul(B, GammaT)
+
+        alphaIndex = scores.argmax(axis=-1)
+        V = scores.max(axis=-1)
+        a = self._pi_array()[alphaIndex]
+
+        return V, a
+
+    def sort(self, W, numThreads=1024):
+        """ Sort the alpha-vectors, and their actions, by their best value over witness beliefs on the GPU.
+
+            The alpha-vectors most likely to be maximal come first, which is useful for pruning. Any
+            device-side alpha-vectors are freed, and are transferred again when they are next used.
+
+            Parameters:
+                W           --  A numpy array for the witness beliefs (k-n array), or a single belief (n array).
+                numThreads  --  The number of CUDA threads to execute (multiple of 32). Default is 1024.
+        """
+
+        W = np.asarray(W, dtype=np.float32)
+        if W.ndim == 0 or W.shape[-1] != self.n:
+            print("Failed to sort the alpha-vectors. The witness beliefs must have %i states." % (self.n))
+            raise Exception()
+
+        W = np.ascontiguousarray(W.reshape((-1, self.n)))
+
+        if self._is_initialized_gpu():
+            npav._nova.pomdp_alpha_vectors_uninitialize_gpu(self)
+
+        result = npav._nova.pomdp_alpha_vectors_sort_gpu(self, int(numThreads), int(W.shape[0]),
+                                W.ctypes.data_as(ct.POINTER(ct.c_float)))
+        if result != 0:
+            print("Failed to sort the alpha-vectors with the 'nova' library's GPU.")
+            raise Exception()
+
+        # Gamma and pi were sorted in place, so only the transposed copy of Gamma is out of date.
+        self._GammaT_np = None
+
+    def _is_initialized_gpu(self):
+        """ Return if any of the alpha-vectors, in any precision, their actions, or batch buffers are on the device.
+
+            Returns:
+                True if any device-side pointer is set, False otherwise.
+        """
+
+        return bool(self.d_Gamma or self.d_GammaHalf or self.d_GammaInt8 or self.d_GammaScale or self.d_pi or
+                    self.d_B or self.d_Bq or self.d_BScale or self.d_Vb or self.d_a)
+
+    def _gamma_array(self):
+        """ Return a numpy view (r-n array) of the alpha-vectors, which does not copy Gamma.
+
+            Returns:
+                The numpy view of Gamma.
+        """
+
+        # Note: Policies returned by the solvers are created by the nova library, so __init__ is
+        # never called on them. Hence, the view is created lazily on first use.
+        if getattr(self, '_Gamma_np', None) is None:
+            # Note: A view of a NULL (or empty) Gamma cannot be created, so use an empty array instead.
+            if self.r == 0 or self.n == 0 or not self.Gamma:
+                self._Gamma_np = np.empty((0, self.n), dtype=np.float32)
+            else:
+                self._Gamma_np = np.ctypeslib.as_array(self.Gamma, shape=(self.r, self.n))
+        return self._Gamma_np
+
+    def _gamma_transposed_array(self):
+        """ Return a contiguous copy (n-r array) of the transposed alpha-vectors, created once.
+
+            Returns:
+                The numpy array of Gamma transposed, in state-major order.
+        """
+
+        if getattr(self, '_GammaT_np', None) is None:
+            self._GammaT_np = np.ascontiguousarray(self._gamma_array().T)
+        return self._GammaT_np
+
+    def _pi_array(self):
+        """ Return a numpy view (r array) of the actions of each alpha-vector, which does not copy pi.
+
+            Returns:
+                The numpy view of pi.
+        """
 
-        return Vb, a
+        if getattr(self, '_pi_np', None) is None:
+            if self.r == 0 or not self.pi:
+                self._pi_np = np.empty((0,), dtype=np.uint32)
+            else:
+                self._pi_np = np.ctypeslib.as_array(self.pi, shape=(self.r,))
+        return self._pi_np
 
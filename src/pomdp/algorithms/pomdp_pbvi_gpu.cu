@@ -289,10 +289,12 @@ int pomdp_pbvi_initialize_gpu(POMDP *pomdp, const float *initialGamma)
                 "Failed to allocate device-side memory for Gamma (prime).");
         return NOVA_ERROR_DEVICE_MALLOC;
     }
-    if (cudaMemcpy(pomdp->d_GammaPrime, initialGamma, pomdp->r * pomdp->n * sizeof(float),
-                    cudaMemcpyHostToDevice) != cudaSuccess) {
+
+    // Note: Gamma is already on the device, so copy it there instead of transferring it from the host again.
+    if (cudaMemcpy(pomdp->d_GammaPrime, pomdp->d_Gamma, pomdp->r * pomdp->n * sizeof(float),
+                    cudaMemcpyDeviceToDevice) != cudaSuccess) {
         fprintf(stderr, "Error[pomdp_pbvi_initialize_gpu]: %s\n",
-                "Failed to copy memory from host to device for Gamma (prime).");
+                "Failed to copy memory from device to device for Gamma (prime).");
         return NOVA_ERROR_MEMCPY_TO_DEVICE;
     }
 
@@ -419,6 +421,8 @@ int pomdp_pbvi_update_gpu(POMDP *pomdp, unsigned int numThreads)
     // The number of blocks in the main CUDA kernel call.
     int numBlocks;
 
+    // Note: The kernels below are launched on the same stream, so each one waits for the previous
+    // one to finish without synchronizing the host. The device is only synchronized after the last one.
     pomdp_pbvi_initialize_alphaBA_gpu<<< dim3(pomdp->r, pomdp->m, 1), numThreads >>>(
                                             pomdp->n, pomdp->m, pomdp->r, pomdp->d_R, pomdp->d_alphaBA);
 
@@ -429,13 +433,6 @@ int pomdp_pbvi_update_gpu(POMDP *pomdp, unsigned int numThreads)
         return NOVA_ERROR_KERNEL_EXECUTION;
     }
 
-    // Wait for the kernel to finish before looping more.
-    if (cudaDeviceSynchronize() != cudaSuccess) {
-        fprintf(stderr, "Error[pomdp_pbvi_update_gpu]: %s\n",
-                    "Failed to synchronize the device after 'initialization of alphaBA' kernel.");
-        return NOVA_ERROR_DEVICE_SYNCHRONIZE;
-    }
-
     pomdp_pbvi_compute_alphaBA_gpu<<< dim3(pomdp->r, pomdp->m, pomdp->z), numThreads,
                                     numThreads * sizeof(float) + numThreads * sizeof(unsigned int) >>>(
                             pomdp->n, pomdp->ns, pomdp->m, pomdp->z, pomdp->r, pomdp->rz, pomdp->gamma,
@@ -450,13 +447,6 @@ int pomdp_pbvi_update_gpu(POMDP *pomdp, unsigned int numThreads)
         return NOVA_ERROR_KERNEL_EXECUTION;
     }
 
-    // Wait for the kernel to finish before looping more.
-    if (cudaDeviceSynchronize() != cudaSuccess) {
-        fprintf(stderr, "Error[pomdp_pbvi_update_gpu]: %s\n",
-                        "Failed to synchronize the device after 'compute_alphaBA' kernel.");
-        return NOVA_ERROR_DEVICE_SYNCHRONIZE;
-    }
-
     // Compute the number of blocks.
     numBlocks = (unsigned int)((float)pomdp->r / (float)numThreads) + 1;
 
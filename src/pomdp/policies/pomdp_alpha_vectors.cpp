@@ -27,34 +27,206 @@
 #include "constants.h"
 
 #include <stdio.h>
+#include <stdint.h>
+#include <cstring>
+#include <cmath>
+
+#if defined(__ARM_NEON) && defined(__aarch64__)
+#include <arm_neon.h>
+#endif
 
 namespace nova {
 
+// The value of an alpha-vector and its index are packed into one 64-bit key, so that the
+// argmax over alpha-vectors is a single branchless unsigned max. The high 32 bits hold the
+// value, mapped to an unsigned integer with the same ordering as the floats. The low 32 bits
+// hold (NOVA_ALPHA_KEY_NONE - 1 - index), so ties go to the lowest index, as with a strict '<'.
+#define NOVA_ALPHA_KEY_NONE 0xFFFFFFFFu
+
+inline uint64_t pomdp_alpha_vectors_key(float value, uint32_t low)
+{
+    uint32_t bits;
+
+    // Note: Adding zero maps -0.0f to 0.0f; they compare equal, so they must have the same key.
+    value += 0.0f;
+    memcpy(&bits, &value, sizeof(uint32_t));
+
+    // Flip all bits of negative values, and only the sign bit of non-negative values.
+    uint32_t mask = (uint32_t)((int32_t)bits >> 31);
+    bits ^= (mask | 0x80000000u);
+
+    return ((uint64_t)bits << 32) | (uint64_t)low;
+}
+
+
+inline float pomdp_alpha_vectors_key_value(uint64_t key)
+{
+    uint32_t bits = (uint32_t)(key >> 32);
+
+    // Undo the mapping above: the sign bit is set for values which were non-negative.
+    uint32_t mask = (bits >> 31) - 1u;
+    bits ^= (mask | 0x80000000u);
+
+    float value;
+    memcpy(&value, &bits, sizeof(float));
+
+    return value;
+}
+
+
+// The dot product of an alpha-vector and a belief. If N is non-zero, then it is the number of states,
+// known at compile time, so the loop is fully unrolled. Otherwise, the number of states is n.
+template <unsigned int N>
+inline float pomdp_alpha_vectors_dot(const float *alpha, const float *b, unsigned int n)
+{
+    const unsigned int numStates = (N > 0 ? N : n);
+
+    float V = 0.0f;
+    unsigned int s = 0;
+
+#if defined(__ARM_NEON) && defined(__aarch64__)
+    // On ARM, the generic loop uses four-wide fused multiply-adds, with a scalar loop for the tail.
+    // Note: This sums in a different order than the scalar loop, so values may differ in the last bits.
+    if (N == 0 && numStates >= 4) {
+        float32x4_t V4 = vdupq_n_f32(0.0f);
+
+        for (; s + 4 <= numStates; s += 4) {
+            V4 = vfmaq_f32(V4, vld1q_f32(&alpha[s]), vld1q_f32(&b[s]));
+        }
+
+        V = vaddvq_f32(V4);
+    }
+#endif
+
+    for (; s < numStates; s++) {
+        V += alpha[s] * b[s];
+    }
+
+    return V;
+}
+
+
+template <unsigned int N>
+inline uint64_t pomdp_alpha_vectors_best_key(const POMDPAlphaVectors *policy, const float *b)
+{
+    // The initial key is FLT_MIN with no alpha-vector. It wins every tie, so an alpha-vector
+    // must be strictly better than FLT_MIN to be selected, as before.
+    uint64_t best = pomdp_alpha_vectors_key(FLT_MIN, NOVA_ALPHA_KEY_NONE);
+
+    for (unsigned int i = 0; i < policy->r; i++) {
+        float V = pomdp_alpha_vectors_dot<N>(&policy->Gamma[i * policy->n], b, policy->n);
+
+        uint64_t key = pomdp_alpha_vectors_key(V, NOVA_ALPHA_KEY_NONE - 1u - i);
+
+        // Branchless: best = max(best, key).
+        best ^= (best ^ key) & (0 - (uint64_t)(key > best));
+    }
+
+    return best;
+}
+
+
 int pomdp_alpha_vectors_value_and_action(const POMDPAlphaVectors *policy,
     const float *b, float &Vb, unsigned int &a)
 {
-    Vb = FLT_MIN;
+    uint64_t best;
+
+    // Specialize on the number of states of common small problems (e.g., Tiger and the 4x3 grid world).
+    switch (policy->n) {
+    case 2:
+        best = pomdp_alpha_vectors_best_key<2>(policy, b);
+        break;
+    case 11:
+        best = pomdp_alpha_vectors_best_key<11>(policy, b);
+        break;
+    default:
+        best = pomdp_alpha_vectors_best_key<0>(policy, b);
+        break;
+    }
+
+    Vb = pomdp_alpha_vectors_key_value(best);
+
+    uint32_t low = (uint32_t)best;
     a = 0;
+    if (low != NOVA_ALPHA_KEY_NONE) {
+        a = policy->pi[NOVA_ALPHA_KEY_NONE - 1u - low];
+    }
 
-    for (unsigned int i = 0; i < policy->r; i++) {
-        float V = 0.0f;
+    return NOVA_SUCCESS;
+}
+
+
+int pomdp_alpha_vectors_value_and_action_after_update(const POMDPAlphaVectors *policy,
+    const POMDP *pomdp, const float *b, unsigned int a, unsigned int o, float *bp,
+    float &Vbp, unsigned int &ap)
+{
+    // Ensure the data is valid.
+    if (policy == nullptr || pomdp == nullptr || policy->n != pomdp->n || b == nullptr ||
+            a >= pomdp->m || o >= pomdp->z || bp == nullptr) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_value_and_action_after_update]: %s\n", "Invalid arguments.");
+        return NOVA_ERROR_INVALID_DATA;
+    }
+
+    // The unnormalized successor belief, i.e., Pr(s', o | b, a), is built in the caller's bp, so nothing
+    // is allocated per update.
+    for (unsigned int sp = 0; sp < pomdp->n; sp++) {
+        bp[sp] = 0.0f;
+    }
 
-        for (unsigned int s = 0; s < policy->n; s++) {
-            V += policy->Gamma[i * policy->n + s] * b[s];
+    for (unsigned int s = 0; s < pomdp->n; s++) {
+        if (b[s] == 0.0f) {
+            continue;
         }
 
-        if (Vb < V) {
-            Vb = V;
-            a = policy->pi[i];
+        for (unsigned int i = 0; i < pomdp->ns; i++) {
+            int sp = pomdp->S[s * pomdp->m * pomdp->ns + a * pomdp->ns + i];
+            if (sp < 0) {
+                break;
+            }
+
+            bp[sp] += pomdp->T[s * pomdp->m * pomdp->ns + a * pomdp->ns + i] * b[s];
         }
     }
 
+    float normalizingConstant = 0.0f;
+
+    for (unsigned int sp = 0; sp < pomdp->n; sp++) {
+        bp[sp] *= pomdp->O[a * pomdp->n * pomdp->z + sp * pomdp->z + o];
+        normalizingConstant += bp[sp];
+    }
+
+    // As in the belief update during expansion, this is a probabilistically impossible observation.
+    if (std::fabs(normalizingConstant) < FLT_ERR_TOL) {
+        return NOVA_WARNING_INVALID_BELIEF;
+    }
+
+    // The values of the unnormalized belief are the true values scaled by the normalizing constant,
+    // which is positive, so the optimal alpha-vector is the same. Only the value is divided by it.
+    pomdp_alpha_vectors_value_and_action(policy, bp, Vbp, ap);
+    if (policy->r > 0) {
+        Vbp /= normalizingConstant;
+    }
+
+    for (unsigned int sp = 0; sp < pomdp->n; sp++) {
+        bp[sp] /= normalizingConstant;
+    }
+
     return NOVA_SUCCESS;
 }
 
 
 int pomdp_alpha_vectors_free(POMDPAlphaVectors *policy)
 {
+    // Device-side memory can only be freed by the GPU version, so it must not be leaked here.
+    if (policy->d_Gamma != nullptr || policy->d_GammaHalf != nullptr || policy->d_GammaInt8 != nullptr ||
+            policy->d_GammaScale != nullptr || policy->d_pi != nullptr ||
+            policy->d_B != nullptr || policy->d_Bq != nullptr || policy->d_BScale != nullptr ||
+            policy->d_Vb != nullptr || policy->d_a != nullptr) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_free]: %s\n",
+                "Invalid arguments. The policy must be uninitialized on the device first.");
+        return NOVA_ERROR_INVALID_DATA;
+    }
+
     policy->n = 0;
     policy->m = 0;
     policy->r = 0;
@@ -0,0 +1,903 @@
+/**
+ *  The MIT License (MIT)
+ *
+ *  Copyright (c) 2015 Kyle Hollins Wray, University of Massachusetts
+ *
+ *  Permission is hereby granted, free of charge, to any person obtaining a copy of
+ *  this software and associated documentation files (the "Software"), to deal in
+ *  the Software without restriction, including without limitation the rights to
+ *  use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+ *  the Software, and to permit persons to whom the Software is furnished to do so,
+ *  subject to the following conditions:
+ *
+ *  The above copyright notice and this permission notice shall be included in all
+ *  copies or substantial portions of the Software.
+ *
+ *  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ *  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+ *  FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+ *  COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+ *  IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+ *  CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+
+#include "policies/pomdp_alpha_vectors_gpu.h"
+#include "error_codes.h"
+#include "constants.h"
+
+#include <stdio.h>
+#include <cmath>
+#include <cstring>
+#include <algorithm>
+#include <cuda_fp16.h>
+
+namespace nova {
+
+// The largest finite value representable in half precision.
+#define NOVA_HALF_MAX 65504.0f
+
+// The number of states in each row of int8 Gamma and the int8 beliefs, padded so that four fit in an int.
+#define NOVA_ALPHA_INT8_STATES(n) ((((n) + 3) / 4) * 4)
+
+__device__ __forceinline__ float pomdp_alpha_vectors_to_float_gpu(float value)
+{
+    return value;
+}
+
+
+__device__ __forceinline__ float pomdp_alpha_vectors_to_float_gpu(__half value)
+{
+    return __half2float(value);
+}
+
+
+__global__ void pomdp_alpha_vectors_convert_half_gpu_kernel(unsigned int size, const float *Gamma,
+        __half *GammaHalf)
+{
+    for (unsigned int i = blockIdx.x * blockDim.x + threadIdx.x; i < size; i += gridDim.x * blockDim.x) {
+        GammaHalf[i] = __float2half(Gamma[i]);
+    }
+}
+
+
+__device__ void pomdp_alpha_vectors_reduce_max_gpu(unsigned int r, float *maxAlphaDotBeta,
+        unsigned int *maxAlphaIndex)
+{
+    // Use reduction to compute the max overall alpha-vector. Ties go to the lowest index, as they
+    // do on the CPU. Note: The stride starts at a power of two so any number of threads works.
+    unsigned int stride = 1;
+    while (stride < blockDim.x) {
+        stride <<= 1;
+    }
+
+    for (stride >>= 1; stride > 0; stride >>= 1) {
+        if (threadIdx.x < stride && threadIdx.x + stride < blockDim.x) {
+            float otherValue = maxAlphaDotBeta[threadIdx.x + stride];
+            unsigned int otherIndex = maxAlphaIndex[threadIdx.x + stride];
+
+            if (otherIndex < r && (maxAlphaIndex[threadIdx.x] == r ||
+                        otherValue > maxAlphaDotBeta[threadIdx.x] ||
+                        (otherValue == maxAlphaDotBeta[threadIdx.x] && otherIndex < maxAlphaIndex[threadIdx.x]))) {
+                maxAlphaDotBeta[threadIdx.x] = otherValue;
+                maxAlphaIndex[threadIdx.x] = otherIndex;
+            }
+        }
+
+        __syncthreads();
+    }
+}
+
+
+template <typename T>
+__global__ void pomdp_alpha_vectors_value_and_action_gpu_kernel(unsigned int n, unsigned int r,
+        unsigned int k, const T *Gamma, const unsigned int *pi, const float *B,
+        float *Vb, unsigned int *a)
+{
+    // Since float and unsigned int are 4 bytes each, and we need each array to be the size of
+    // the number of threads, we will need to call this with:
+    // sizeof(float) * numThreads + sizeof(unsigned int) * numThreads.
+    // Note: blockDim.x == numThreads
+    extern __shared__ float sdata[];
+    float *maxAlphaDotBeta = (float *)sdata;
+    unsigned int *maxAlphaIndex = (unsigned int *)&maxAlphaDotBeta[blockDim.x];
+
+    // Each block computes the value of a different belief.
+    unsigned int beliefIndex = blockIdx.x;
+    if (beliefIndex >= k) {
+        return;
+    }
+
+    maxAlphaDotBeta[threadIdx.x] = FLT_MIN;
+    maxAlphaIndex[threadIdx.x] = r;
+
+    // Compute the max over the alpha-vectors strided by this thread. The reduction is
+    // computed afterwards for the max over all alpha-vectors.
+    for (unsigned int alphaIndex = threadIdx.x; alphaIndex < r; alphaIndex += blockDim.x) {
+        float alphaDotBeta = 0.0f;
+
+        for (unsigned int s = 0; s < n; s++) {
+            // Note: Gamma may be stored in half precision, but the dot product is always accumulated in single.
+            alphaDotBeta += pomdp_alpha_vectors_to_float_gpu(Gamma[alphaIndex * n + s]) * B[beliefIndex * n + s];
+        }
+
+        if (maxAlphaIndex[threadIdx.x] == r || alphaDotBeta > maxAlphaDotBeta[threadIdx.x]) {
+            maxAlphaDotBeta[threadIdx.x] = alphaDotBeta;
+            maxAlphaIndex[threadIdx.x] = alphaIndex;
+        }
+    }
+
+    __syncthreads();
+
+    pomdp_alpha_vectors_reduce_max_gpu(r, maxAlphaDotBeta, maxAlphaIndex);
+
+    if (threadIdx.x == 0) {
+        Vb[beliefIndex] = maxAlphaDotBeta[0];
+        a[beliefIndex] = pi[maxAlphaIndex[0]];
+    }
+}
+
+
+__global__ void pomdp_alpha_vectors_quantize_beliefs_gpu_kernel(unsigned int n, unsigned int nq,
+        unsigned int k, const float *B, signed char *Bq, float *BScale)
+{
+    // The shared memory holds the max probability found by each thread.
+    extern __shared__ float maxProbability[];
+
+    // Each block quantizes a different belief.
+    unsigned int beliefIndex = blockIdx.x;
+    if (beliefIndex >= k) {
+        return;
+    }
+
+    maxProbability[threadIdx.x] = 0.0f;
+
+    for (unsigned int s = threadIdx.x; s < n; s += blockDim.x) {
+        maxProbability[threadIdx.x] = fmaxf(maxProbability[threadIdx.x], B[beliefIndex * n + s]);
+    }
+
+    __syncthreads();
+
+    // Note: As in the reduction over alpha-vectors, the stride starts at a power of two.
+    unsigned int stride = 1;
+    while (stride < blockDim.x) {
+        stride <<= 1;
+    }
+
+    for (stride >>= 1; stride > 0; stride >>= 1) {
+        if (threadIdx.x < stride && threadIdx.x + stride < blockDim.x) {
+            maxProbability[threadIdx.x] = fmaxf(maxProbability[threadIdx.x],
+                                                maxProbability[threadIdx.x + stride]);
+        }
+
+        __syncthreads();
+    }
+
+    // Each belief has its own scale, max_s b(s) / 127, so even spread-out beliefs use the full int8
+    // range. States past n are the zero padding.
+    float maxB = maxProbability[0];
+    float invScale = 0.0f;
+    if (maxB > 0.0f) {
+        invScale = 127.0f / maxB;
+    }
+
+    for (unsigned int s = threadIdx.x; s < nq; s += blockDim.x) {
+        int q = 0;
+        if (s < n) {
+            q = min(max(__float2int_rn(B[beliefIndex * n + s] * invScale), -127), 127);
+        }
+
+        Bq[beliefIndex * nq + s] = (signed char)q;
+    }
+
+    if (threadIdx.x == 0) {
+        BScale[beliefIndex] = maxB / 127.0f;
+    }
+}
+
+
+__device__ __forceinline__ int pomdp_alpha_vectors_dot4_gpu(int x, int y, int c)
+{
+    // Note: The Makefile and CMake build generate sm_61 code, so __dp4a is used on those GPUs and newer.
+#if __CUDA_ARCH__ >= 610
+    return __dp4a(x, y, c);
+#else
+    for (unsigned int i = 0; i < 4; i++) {
+        c += (int)(signed char)(x >> (8 * i)) * (int)(signed char)(y >> (8 * i));
+    }
+    return c;
+#endif
+}
+
+
+__global__ void pomdp_alpha_vectors_value_and_action_int8_gpu_kernel(unsigned int nq, unsigned int r,
+        unsigned int k, const int *GammaInt8, const float *GammaScale, const unsigned int *pi,
+        const int *Bq, const float *BScale, float *Vb, unsigned int *a)
+{
+    // The shared memory is the same as the other 'value and action' kernel.
+    extern __shared__ float sdata[];
+    float *maxAlphaDotBeta = (float *)sdata;
+    unsigned int *maxAlphaIndex = (unsigned int *)&maxAlphaDotBeta[blockDim.x];
+
+    // Each block computes the value of a different belief.
+    unsigned int beliefIndex = blockIdx.x;
+    if (beliefIndex >= k) {
+        return;
+    }
+
+    maxAlphaDotBeta[threadIdx.x] = FLT_MIN;
+    maxAlphaIndex[threadIdx.x] = r;
+
+    // Note: Each int holds four int8 states, since nq is a multiple of four.
+    unsigned int nw = nq / 4;
+    float beliefScale = BScale[beliefIndex];
+
+    for (unsigned int alphaIndex = threadIdx.x; alphaIndex < r; alphaIndex += blockDim.x) {
+        int rawAlphaDotBeta = 0;
+
+        for (unsigned int w = 0; w < nw; w++) {
+            rawAlphaDotBeta = pomdp_alpha_vectors_dot4_gpu(GammaInt8[alphaIndex * nw + w],
+                                                            Bq[beliefIndex * nw + w], rawAlphaDotBeta);
+        }
+
+        // Dequantize with the scale of this alpha-vector and the scale of the belief.
+        float alphaDotBeta = (float)rawAlphaDotBeta * GammaScale[alphaIndex] * beliefScale;
+
+        if (maxAlphaIndex[threadIdx.x] == r || alphaDotBeta > maxAlphaDotBeta[threadIdx.x]) {
+            maxAlphaDotBeta[threadIdx.x] = alphaDotBeta;
+            maxAlphaIndex[threadIdx.x] = alphaIndex;
+        }
+    }
+
+    __syncthreads();
+
+    pomdp_alpha_vectors_reduce_max_gpu(r, maxAlphaDotBeta, maxAlphaIndex);
+
+    if (threadIdx.x == 0) {
+        Vb[beliefIndex] = maxAlphaDotBeta[0];
+        a[beliefIndex] = pi[maxAlphaIndex[0]];
+    }
+}
+
+
+__global__ void pomdp_alpha_vectors_witness_scores_gpu_kernel(unsigned int n, unsigned int r,
+        unsigned int k, const float *Gamma, const float *W, float *scores, unsigned int *indexes)
+{
+    // Each thread computes the score of a different alpha-vector: its best value over the witness beliefs.
+    unsigned int alphaIndex = blockIdx.x * blockDim.x + threadIdx.x;
+    if (alphaIndex >= r) {
+        return;
+    }
+
+    float score = FLT_MIN;
+
+    for (unsigned int w = 0; w < k; w++) {
+        float alphaDotBeta = 0.0f;
+
+        for (unsigned int s = 0; s < n; s++) {
+            alphaDotBeta += Gamma[alphaIndex * n + s] * W[w * n + s];
+        }
+
+        if (w == 0 || alphaDotBeta > score) {
+            score = alphaDotBeta;
+        }
+    }
+
+    scores[alphaIndex] = score;
+    indexes[alphaIndex] = alphaIndex;
+}
+
+
+__device__ __forceinline__ bool pomdp_alpha_vectors_precedes_gpu(unsigned int r,
+        float score, unsigned int index, float otherScore, unsigned int otherIndex)
+{
+    // Higher scores come first, with ties broken by the lower index. Any padding (i.e., index >= r) comes last.
+    return index < r && (otherIndex >= r || score > otherScore || (score == otherScore && index < otherIndex));
+}
+
+
+__global__ void pomdp_alpha_vectors_bitonic_step_gpu_kernel(unsigned int r, unsigned int size,
+        unsigned int j, unsigned int kk, float *scores, unsigned int *indexes)
+{
+    unsigned int i = blockIdx.x * blockDim.x + threadIdx.x;
+    unsigned int partner = i ^ j;
+
+    // Only the lower element of each pair performs the compare-and-swap.
+    if (i >= size || partner <= i) {
+        return;
+    }
+
+    // The direction of this pair's bitonic subsequence: the lower element should precede the other,
+    // or vice versa.
+    bool swap = false;
+    if ((i & kk) == 0) {
+        swap = pomdp_alpha_vectors_precedes_gpu(r, scores[partner], indexes[partner], scores[i], indexes[i]);
+    } else {
+        swap = pomdp_alpha_vectors_precedes_gpu(r, scores[i], indexes[i], scores[partner], indexes[partner]);
+    }
+
+    if (swap) {
+        float score = scores[i];
+        scores[i] = scores[partner];
+        scores[partner] = score;
+
+        unsigned int index = indexes[i];
+        indexes[i] = indexes[partner];
+        indexes[partner] = index;
+    }
+}
+
+
+__global__ void pomdp_alpha_vectors_permute_gpu_kernel(unsigned int n, unsigned int r,
+        const float *Gamma, const unsigned int *indexes, float *GammaSorted)
+{
+    for (unsigned int i = blockIdx.x * blockDim.x + threadIdx.x; i < r * n; i += gridDim.x * blockDim.x) {
+        GammaSorted[i] = Gamma[indexes[i / n] * n + i % n];
+    }
+}
+
+
+int pomdp_alpha_vectors_initialize_gpu(POMDPAlphaVectors *policy)
+{
+    // Ensure the data is valid.
+    if (policy == nullptr || policy->n == 0 || policy->r == 0 ||
+            policy->Gamma == nullptr || policy->pi == nullptr) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_initialize_gpu]: %s\n", "Invalid input.");
+        return NOVA_ERROR_INVALID_DATA;
+    }
+
+    // Create the device-side Gamma.
+    if (cudaMalloc(&policy->d_Gamma, policy->r * policy->n * sizeof(float)) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_initialize_gpu]: %s\n",
+                "Failed to allocate device-side memory for Gamma.");
+        return NOVA_ERROR_DEVICE_MALLOC;
+    }
+    if (cudaMemcpy(policy->d_Gamma, policy->Gamma, policy->r * policy->n * sizeof(float),
+                    cudaMemcpyHostToDevice) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_initialize_gpu]: %s\n",
+                "Failed to copy memory from host to device for Gamma.");
+        return NOVA_ERROR_MEMCPY_TO_DEVICE;
+    }
+
+    // Create the device-side pi.
+    if (cudaMalloc(&policy->d_pi, policy->r * sizeof(unsigned int)) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_initialize_gpu]: %s\n",
+                "Failed to allocate device-side memory for pi.");
+        return NOVA_ERROR_DEVICE_MALLOC;
+    }
+    if (cudaMemcpy(policy->d_pi, policy->pi, policy->r * sizeof(unsigned int),
+                    cudaMemcpyHostToDevice) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_initialize_gpu]: %s\n",
+                "Failed to copy memory from host to device for pi.");
+        return NOVA_ERROR_MEMCPY_TO_DEVICE;
+    }
+
+    return NOVA_SUCCESS;
+}
+
+
+int pomdp_alpha_vectors_initialize_half_gpu(POMDPAlphaVectors *policy)
+{
+    // Ensure the data is valid.
+    if (policy == nullptr || policy->n == 0 || policy->r == 0 ||
+            policy->Gamma == nullptr || policy->pi == nullptr) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_initialize_half_gpu]: %s\n", "Invalid input.");
+        return NOVA_ERROR_INVALID_DATA;
+    }
+
+    // Ensure every value of Gamma is representable; otherwise, it would become infinite.
+    for (unsigned int i = 0; i < policy->r * policy->n; i++) {
+        if (std::fabs(policy->Gamma[i]) > NOVA_HALF_MAX) {
+            fprintf(stderr, "Error[pomdp_alpha_vectors_initialize_half_gpu]: %s\n",
+                    "Gamma has values which are out of range for half precision.");
+            return NOVA_ERROR_INVALID_DATA;
+        }
+    }
+
+    int result;
+
+    // The temporary device-side single precision Gamma, which is converted to half precision on the device.
+    float *d_GammaSingle = nullptr;
+
+    result = NOVA_SUCCESS;
+
+    if (cudaMalloc(&d_GammaSingle, policy->r * policy->n * sizeof(float)) != cudaSuccess ||
+            cudaMalloc(&policy->d_GammaHalf, policy->r * policy->n * sizeof(unsigned short)) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_initialize_half_gpu]: %s\n",
+                "Failed to allocate device-side memory for Gamma.");
+        result = NOVA_ERROR_DEVICE_MALLOC;
+    }
+
+    if (result == NOVA_SUCCESS && cudaMemcpy(d_GammaSingle, policy->Gamma, policy->r * policy->n * sizeof(float),
+                                            cudaMemcpyHostToDevice) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_initialize_half_gpu]: %s\n",
+                "Failed to copy memory from host to device for Gamma.");
+        result = NOVA_ERROR_MEMCPY_TO_DEVICE;
+    }
+
+    if (result == NOVA_SUCCESS) {
+        unsigned int numThreads = 256;
+        unsigned int numBlocks = std::min(policy->r * policy->n / numThreads + 1, 65535u);
+
+        pomdp_alpha_vectors_convert_half_gpu_kernel<<< numBlocks, numThreads >>>(policy->r * policy->n,
+                                d_GammaSingle, (__half *)policy->d_GammaHalf);
+
+        // Check if there was an error executing the kernel.
+        if (cudaGetLastError() != cudaSuccess) {
+            fprintf(stderr, "Error[pomdp_alpha_vectors_initialize_half_gpu]: %s\n",
+                            "Failed to execute the 'convert to half precision' kernel.");
+            result = NOVA_ERROR_KERNEL_EXECUTION;
+        }
+    }
+
+    if (result == NOVA_SUCCESS && cudaDeviceSynchronize() != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_initialize_half_gpu]: %s\n",
+                        "Failed to synchronize the device after 'convert to half precision' kernel.");
+        result = NOVA_ERROR_DEVICE_SYNCHRONIZE;
+    }
+
+    if (d_GammaSingle != nullptr && cudaFree(d_GammaSingle) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_initialize_half_gpu]: %s\n",
+                "Failed to free device-side memory for Gamma (single precision).");
+        result = NOVA_ERROR_DEVICE_FREE;
+    }
+
+    if (result != NOVA_SUCCESS) {
+        return result;
+    }
+
+    // Create the device-side pi.
+    if (cudaMalloc(&policy->d_pi, policy->r * sizeof(unsigned int)) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_initialize_half_gpu]: %s\n",
+                "Failed to allocate device-side memory for pi.");
+        return NOVA_ERROR_DEVICE_MALLOC;
+    }
+    if (cudaMemcpy(policy->d_pi, policy->pi, policy->r * sizeof(unsigned int),
+                    cudaMemcpyHostToDevice) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_initialize_half_gpu]: %s\n",
+                "Failed to copy memory from host to device for pi.");
+        return NOVA_ERROR_MEMCPY_TO_DEVICE;
+    }
+
+    return NOVA_SUCCESS;
+}
+
+
+int pomdp_alpha_vectors_initialize_int8_gpu(POMDPAlphaVectors *policy)
+{
+    // Ensure the data is valid.
+    if (policy == nullptr || policy->n == 0 || policy->r == 0 ||
+            policy->Gamma == nullptr || policy->pi == nullptr) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_initialize_int8_gpu]: %s\n", "Invalid input.");
+        return NOVA_ERROR_INVALID_DATA;
+    }
+
+    // Quantize on the host, since this is only done once. Each row is padded to a multiple of four states.
+    unsigned int nq = NOVA_ALPHA_INT8_STATES(policy->n);
+
+    signed char *GammaInt8 = new signed char[policy->r * nq];
+    float *GammaScale = new float[policy->r];
+
+    for (unsigned int i = 0; i < policy->r; i++) {
+        float maxAbs = 0.0f;
+        for (unsigned int s = 0; s < policy->n; s++) {
+            maxAbs = std::max(maxAbs, (float)std::fabs(policy->Gamma[i * policy->n + s]));
+        }
+
+        GammaScale[i] = maxAbs / 127.0f;
+
+        for (unsigned int s = 0; s < nq; s++) {
+            int q = 0;
+            if (s < policy->n && maxAbs > 0.0f) {
+                q = (int)std::lround(policy->Gamma[i * policy->n + s] / GammaScale[i]);
+                q = std::min(std::max(q, -127), 127);
+            }
+            GammaInt8[i * nq + s] = (signed char)q;
+        }
+    }
+
+    int result;
+
+    result = NOVA_SUCCESS;
+
+    if (cudaMalloc(&policy->d_GammaInt8, policy->r * nq * sizeof(signed char)) != cudaSuccess ||
+            cudaMalloc(&policy->d_GammaScale, policy->r * sizeof(float)) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_initialize_int8_gpu]: %s\n",
+                "Failed to allocate device-side memory for Gamma.");
+        result = NOVA_ERROR_DEVICE_MALLOC;
+    }
+
+    if (result == NOVA_SUCCESS && (cudaMemcpy(policy->d_GammaInt8, GammaInt8, policy->r * nq * sizeof(signed char),
+                                            cudaMemcpyHostToDevice) != cudaSuccess ||
+                                    cudaMemcpy(policy->d_GammaScale, GammaScale, policy->r * sizeof(float),
+                                            cudaMemcpyHostToDevice) != cudaSuccess)) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_initialize_int8_gpu]: %s\n",
+                "Failed to copy memory from host to device for Gamma.");
+        result = NOVA_ERROR_MEMCPY_TO_DEVICE;
+    }
+
+    delete [] GammaInt8;
+    delete [] GammaScale;
+
+    if (result != NOVA_SUCCESS) {
+        return result;
+    }
+
+    // Create the device-side pi.
+    if (cudaMalloc(&policy->d_pi, policy->r * sizeof(unsigned int)) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_initialize_int8_gpu]: %s\n",
+                "Failed to allocate device-side memory for pi.");
+        return NOVA_ERROR_DEVICE_MALLOC;
+    }
+    if (cudaMemcpy(policy->d_pi, policy->pi, policy->r * sizeof(unsigned int),
+                    cudaMemcpyHostToDevice) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_initialize_int8_gpu]: %s\n",
+                "Failed to copy memory from host to device for pi.");
+        return NOVA_ERROR_MEMCPY_TO_DEVICE;
+    }
+
+    return NOVA_SUCCESS;
+}
+
+
+int pomdp_alpha_vectors_uninitialize_gpu(POMDPAlphaVectors *policy)
+{
+    int result;
+
+    result = pomdp_alpha_vectors_uninitialize_batch_gpu(policy);
+
+    if (policy->d_Gamma != nullptr) {
+        if (cudaFree(policy->d_Gamma) != cudaSuccess) {
+            fprintf(stderr, "Error[pomdp_alpha_vectors_uninitialize_gpu]: %s\n",
+                    "Failed to free device-side memory for Gamma (the alpha-vectors).");
+            result = NOVA_ERROR_DEVICE_FREE;
+        }
+    }
+    policy->d_Gamma = nullptr;
+
+    if (policy->d_GammaHalf != nullptr) {
+        if (cudaFree(policy->d_GammaHalf) != cudaSuccess) {
+            fprintf(stderr, "Error[pomdp_alpha_vectors_uninitialize_gpu]: %s\n",
+                    "Failed to free device-side memory for Gamma (half precision).");
+            result = NOVA_ERROR_DEVICE_FREE;
+        }
+    }
+    policy->d_GammaHalf = nullptr;
+
+    if (policy->d_GammaInt8 != nullptr) {
+        if (cudaFree(policy->d_GammaInt8) != cudaSuccess) {
+            fprintf(stderr, "Error[pomdp_alpha_vectors_uninitialize_gpu]: %s\n",
+                    "Failed to free device-side memory for Gamma (int8).");
+            result = NOVA_ERROR_DEVICE_FREE;
+        }
+    }
+    policy->d_GammaInt8 = nullptr;
+
+    if (policy->d_GammaScale != nullptr) {
+        if (cudaFree(policy->d_GammaScale) != cudaSuccess) {
+            fprintf(stderr, "Error[pomdp_alpha_vectors_uninitialize_gpu]: %s\n",
+                    "Failed to free device-side memory for the scales of Gamma (int8).");
+            result = NOVA_ERROR_DEVICE_FREE;
+        }
+    }
+    policy->d_GammaScale = nullptr;
+
+    if (policy->d_pi != nullptr) {
+        if (cudaFree(policy->d_pi) != cudaSuccess) {
+            fprintf(stderr, "Error[pomdp_alpha_vectors_uninitialize_gpu]: %s\n",
+                    "Failed to free device-side memory for pi (the policy).");
+            result = NOVA_ERROR_DEVICE_FREE;
+        }
+    }
+    policy->d_pi = nullptr;
+
+    return result;
+}
+
+
+int pomdp_alpha_vectors_reserve_batch_gpu(POMDPAlphaVectors *policy, unsigned int k)
+{
+    // The batch buffers are reused while they are large enough, and the int8 beliefs exist if needed.
+    if (k <= policy->kBatch && (policy->d_GammaInt8 == nullptr ||
+            (policy->d_Bq != nullptr && policy->d_BScale != nullptr))) {
+        return NOVA_SUCCESS;
+    }
+
+    int result;
+
+    result = pomdp_alpha_vectors_uninitialize_batch_gpu(policy);
+    if (result != NOVA_SUCCESS) {
+        return result;
+    }
+
+    if (cudaMalloc(&policy->d_B, k * policy->n * sizeof(float)) != cudaSuccess ||
+            cudaMalloc(&policy->d_Vb, k * sizeof(float)) != cudaSuccess ||
+            cudaMalloc(&policy->d_a, k * sizeof(unsigned int)) != cudaSuccess ||
+            (policy->d_GammaInt8 != nullptr &&
+                (cudaMalloc(&policy->d_Bq, k * NOVA_ALPHA_INT8_STATES(policy->n) * sizeof(signed char)) != cudaSuccess ||
+                 cudaMalloc(&policy->d_BScale, k * sizeof(float)) != cudaSuccess))) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_reserve_batch_gpu]: %s\n",
+                "Failed to allocate device-side memory for the beliefs and their values and actions.");
+        pomdp_alpha_vectors_uninitialize_batch_gpu(policy);
+        return NOVA_ERROR_DEVICE_MALLOC;
+    }
+
+    policy->kBatch = k;
+
+    return NOVA_SUCCESS;
+}
+
+
+int pomdp_alpha_vectors_uninitialize_batch_gpu(POMDPAlphaVectors *policy)
+{
+    int result;
+
+    result = NOVA_SUCCESS;
+
+    if (policy->d_B != nullptr && cudaFree(policy->d_B) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_uninitialize_batch_gpu]: %s\n",
+                "Failed to free device-side memory for the beliefs.");
+        result = NOVA_ERROR_DEVICE_FREE;
+    }
+    policy->d_B = nullptr;
+
+    if (policy->d_Bq != nullptr && cudaFree(policy->d_Bq) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_uninitialize_batch_gpu]: %s\n",
+                "Failed to free device-side memory for the quantized beliefs.");
+        result = NOVA_ERROR_DEVICE_FREE;
+    }
+    policy->d_Bq = nullptr;
+
+    if (policy->d_BScale != nullptr && cudaFree(policy->d_BScale) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_uninitialize_batch_gpu]: %s\n",
+                "Failed to free device-side memory for the scales of the quantized beliefs.");
+        result = NOVA_ERROR_DEVICE_FREE;
+    }
+    policy->d_BScale = nullptr;
+
+    if (policy->d_Vb != nullptr && cudaFree(policy->d_Vb) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_uninitialize_batch_gpu]: %s\n",
+                "Failed to free device-side memory for the values.");
+        result = NOVA_ERROR_DEVICE_FREE;
+    }
+    policy->d_Vb = nullptr;
+
+    if (policy->d_a != nullptr && cudaFree(policy->d_a) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_uninitialize_batch_gpu]: %s\n",
+                "Failed to free device-side memory for the actions.");
+        result = NOVA_ERROR_DEVICE_FREE;
+    }
+    policy->d_a = nullptr;
+
+    policy->kBatch = 0;
+
+    return result;
+}
+
+
+int pomdp_alpha_vectors_value_and_action_gpu(POMDPAlphaVectors *policy,
+    unsigned int numThreads, unsigned int k, const float *B, float *Vb, unsigned int *a)
+{
+    // Ensure the data is valid.
+    if (policy == nullptr || policy->n == 0 || policy->r == 0 ||
+            (policy->d_Gamma == nullptr && policy->d_GammaHalf == nullptr &&
+                (policy->d_GammaInt8 == nullptr || policy->d_GammaScale == nullptr)) ||
+            policy->d_pi == nullptr || k == 0 || B == nullptr || Vb == nullptr || a == nullptr) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_value_and_action_gpu]: %s\n", "Invalid arguments.");
+        return NOVA_ERROR_INVALID_DATA;
+    }
+
+    // Ensure threads are correct.
+    if (numThreads == 0 || numThreads % 32 != 0) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_value_and_action_gpu]: %s\n", "Invalid number of threads.");
+        return NOVA_ERROR_INVALID_CUDA_PARAM;
+    }
+
+    // Reuse the device-side beliefs, values, and actions of previous batches, if they are large enough.
+    int result = pomdp_alpha_vectors_reserve_batch_gpu(policy, k);
+    if (result != NOVA_SUCCESS) {
+        return result;
+    }
+
+    // Transfer the entire batch of beliefs at once.
+    if (cudaMemcpy(policy->d_B, B, k * policy->n * sizeof(float), cudaMemcpyHostToDevice) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_value_and_action_gpu]: %s\n",
+                "Failed to copy memory from host to device for the beliefs.");
+        return NOVA_ERROR_MEMCPY_TO_DEVICE;
+    }
+
+    // Use the int8 or half precision Gamma, if it was the one transferred to the device.
+    if (policy->d_GammaInt8 != nullptr) {
+        unsigned int nq = NOVA_ALPHA_INT8_STATES(policy->n);
+
+        pomdp_alpha_vectors_quantize_beliefs_gpu_kernel<<< k, numThreads, numThreads * sizeof(float) >>>(
+                                policy->n, nq, k, policy->d_B, policy->d_Bq, policy->d_BScale);
+
+        pomdp_alpha_vectors_value_and_action_int8_gpu_kernel<<< k, numThreads,
+                                numThreads * sizeof(float) + numThreads * sizeof(unsigned int) >>>(
+                                nq, policy->r, k, (const int *)policy->d_GammaInt8, policy->d_GammaScale,
+                                policy->d_pi, (const int *)policy->d_Bq, policy->d_BScale, policy->d_Vb, policy->d_a);
+    } else if (policy->d_GammaHalf != nullptr) {
+        pomdp_alpha_vectors_value_and_action_gpu_kernel<__half><<< k, numThreads,
+                                numThreads * sizeof(float) + numThreads * sizeof(unsigned int) >>>(
+                                policy->n, policy->r, k, (const __half *)policy->d_GammaHalf, policy->d_pi,
+                                policy->d_B, policy->d_Vb, policy->d_a);
+    } else {
+        pomdp_alpha_vectors_value_and_action_gpu_kernel<float><<< k, numThreads,
+                                numThreads * sizeof(float) + numThreads * sizeof(unsigned int) >>>(
+                                policy->n, policy->r, k, policy->d_Gamma, policy->d_pi,
+                                policy->d_B, policy->d_Vb, policy->d_a);
+    }
+
+    // Check if there was an error launching the kernel.
+    if (cudaGetLastError() != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_value_and_action_gpu]: %s\n",
+                        "Failed to execute the 'value and action' kernel.");
+        return NOVA_ERROR_KERNEL_EXECUTION;
+    }
+
+    // Note: These copies wait for the kernels to finish, so the device is not synchronized beforehand.
+    // Any error from executing the kernels is also reported by them.
+    if (cudaMemcpy(Vb, policy->d_Vb, k * sizeof(float), cudaMemcpyDeviceToHost) != cudaSuccess ||
+            cudaMemcpy(a, policy->d_a, k * sizeof(unsigned int), cudaMemcpyDeviceToHost) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_value_and_action_gpu]: %s\n",
+                "Failed to copy memory from device to host for the values and actions.");
+        return NOVA_ERROR_MEMCPY_TO_HOST;
+    }
+
+    return NOVA_SUCCESS;
+}
+
+
+int pomdp_alpha_vectors_sort_gpu(POMDPAlphaVectors *policy, unsigned int numThreads,
+    unsigned int k, const float *W)
+{
+    // Ensure the data is valid.
+    if (policy == nullptr || policy->n == 0 || policy->r == 0 ||
+            policy->Gamma == nullptr || policy->pi == nullptr || k == 0 || W == nullptr) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_sort_gpu]: %s\n", "Invalid arguments.");
+        return NOVA_ERROR_INVALID_DATA;
+    }
+
+    // The device-side alpha-vectors would no longer match the host-side ones afterwards.
+    if (policy->d_Gamma != nullptr || policy->d_GammaHalf != nullptr || policy->d_GammaInt8 != nullptr ||
+            policy->d_GammaScale != nullptr || policy->d_pi != nullptr) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_sort_gpu]: %s\n",
+                "Invalid arguments. The policy must not be initialized on the device.");
+        return NOVA_ERROR_INVALID_DATA;
+    }
+
+    // Ensure threads are correct.
+    if (numThreads == 0 || numThreads % 32 != 0) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_sort_gpu]: %s\n", "Invalid number of threads.");
+        return NOVA_ERROR_INVALID_CUDA_PARAM;
+    }
+
+    // Bitonic sort requires a power of two number of elements, so the scores are padded.
+    unsigned int size = 1;
+    while (size < policy->r) {
+        size <<= 1;
+    }
+
+    int result;
+
+    float *d_GammaUnsorted = nullptr;
+    float *d_GammaSorted = nullptr;
+    float *d_W = nullptr;
+    float *d_scores = nullptr;
+    unsigned int *d_indexes = nullptr;
+
+    unsigned int *indexes = nullptr;
+    unsigned int *piUnsorted = nullptr;
+
+    result = NOVA_SUCCESS;
+
+    if (cudaMalloc(&d_GammaUnsorted, policy->r * policy->n * sizeof(float)) != cudaSuccess ||
+            cudaMalloc(&d_GammaSorted, policy->r * policy->n * sizeof(float)) != cudaSuccess ||
+            cudaMalloc(&d_W, k * policy->n * sizeof(float)) != cudaSuccess ||
+            cudaMalloc(&d_scores, size * sizeof(float)) != cudaSuccess ||
+            cudaMalloc(&d_indexes, size * sizeof(unsigned int)) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_sort_gpu]: %s\n",
+                "Failed to allocate device-side memory for the alpha-vectors, witness beliefs, and scores.");
+        result = NOVA_ERROR_DEVICE_MALLOC;
+    }
+
+    if (result == NOVA_SUCCESS && (cudaMemcpy(d_GammaUnsorted, policy->Gamma,
+                                            policy->r * policy->n * sizeof(float),
+                                            cudaMemcpyHostToDevice) != cudaSuccess ||
+                                    cudaMemcpy(d_W, W, k * policy->n * sizeof(float),
+                                            cudaMemcpyHostToDevice) != cudaSuccess)) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_sort_gpu]: %s\n",
+                "Failed to copy memory from host to device for the alpha-vectors and witness beliefs.");
+        result = NOVA_ERROR_MEMCPY_TO_DEVICE;
+    }
+
+    // Mark the padding so that it is sorted after every alpha-vector.
+    if (result == NOVA_SUCCESS && cudaMemset(d_indexes, 0xFF, size * sizeof(unsigned int)) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_sort_gpu]: %s\n", "Failed to set the padding of the scores.");
+        result = NOVA_ERROR_MEMCPY_TO_DEVICE;
+    }
+
+    if (result == NOVA_SUCCESS) {
+        pomdp_alpha_vectors_witness_scores_gpu_kernel<<< policy->r / numThreads + 1, numThreads >>>(
+                                policy->n, policy->r, k, d_GammaUnsorted, d_W, d_scores, d_indexes);
+
+        // Sort the scores (and their indexes) with O(log^2 r) passes, each of which is fully parallel.
+        for (unsigned int kk = 2; kk <= size; kk <<= 1) {
+            for (unsigned int j = kk >> 1; j > 0; j >>= 1) {
+                pomdp_alpha_vectors_bitonic_step_gpu_kernel<<< size / numThreads + 1, numThreads >>>(
+                                policy->r, size, j, kk, d_scores, d_indexes);
+            }
+        }
+
+        unsigned int numBlocks = std::min(policy->r * policy->n / numThreads + 1, 65535u);
+        pomdp_alpha_vectors_permute_gpu_kernel<<< numBlocks, numThreads >>>(policy->n, policy->r,
+                                d_GammaUnsorted, d_indexes, d_GammaSorted);
+
+        // Check if there was an error executing the kernels.
+        if (cudaGetLastError() != cudaSuccess) {
+            fprintf(stderr, "Error[pomdp_alpha_vectors_sort_gpu]: %s\n",
+                            "Failed to execute the 'sort' kernels.");
+            result = NOVA_ERROR_KERNEL_EXECUTION;
+        }
+    }
+
+    if (result == NOVA_SUCCESS && cudaDeviceSynchronize() != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_sort_gpu]: %s\n",
+                        "Failed to synchronize the device after 'sort' kernels.");
+        result = NOVA_ERROR_DEVICE_SYNCHRONIZE;
+    }
+
+    // Copy the sorted alpha-vectors directly into Gamma, and apply the same permutation to pi.
+    if (result == NOVA_SUCCESS) {
+        indexes = new unsigned int[policy->r];
+        piUnsorted = new unsigned int[policy->r];
+
+        if (cudaMemcpy(indexes, d_indexes, policy->r * sizeof(unsigned int),
+                        cudaMemcpyDeviceToHost) != cudaSuccess ||
+                cudaMemcpy(policy->Gamma, d_GammaSorted, policy->r * policy->n * sizeof(float),
+                        cudaMemcpyDeviceToHost) != cudaSuccess) {
+            fprintf(stderr, "Error[pomdp_alpha_vectors_sort_gpu]: %s\n",
+                    "Failed to copy memory from device to host for the sorted alpha-vectors.");
+            result = NOVA_ERROR_MEMCPY_TO_HOST;
+        }
+    }
+
+    if (result == NOVA_SUCCESS) {
+        memcpy(piUnsorted, policy->pi, policy->r * sizeof(unsigned int));
+        for (unsigned int i = 0; i < policy->r; i++) {
+            policy->pi[i] = piUnsorted[indexes[i]];
+        }
+    }
+
+    if (indexes != nullptr) {
+        delete [] indexes;
+    }
+    if (piUnsorted != nullptr) {
+        delete [] piUnsorted;
+    }
+
+    // Free the temporary device-side memory, regardless of any errors above.
+    if ((d_GammaUnsorted != nullptr && cudaFree(d_GammaUnsorted) != cudaSuccess) ||
+            (d_GammaSorted != nullptr && cudaFree(d_GammaSorted) != cudaSuccess)) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_sort_gpu]: %s\n",
+                "Failed to free device-side memory for the alpha-vectors.");
+        result = NOVA_ERROR_DEVICE_FREE;
+    }
+    if (d_W != nullptr && cudaFree(d_W) != cudaSuccess) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_sort_gpu]: %s\n",
+                "Failed to free device-side memory for the witness beliefs.");
+        result = NOVA_ERROR_DEVICE_FREE;
+    }
+    if ((d_scores != nullptr && cudaFree(d_scores) != cudaSuccess) ||
+            (d_indexes != nullptr && cudaFree(d_indexes) != cudaSuccess)) {
+        fprintf(stderr, "Error[pomdp_alpha_vectors_sort_gpu]: %s\n",
+                "Failed to free device-side memory for the scores.");
+        result = NOVA_ERROR_DEVICE_FREE;
+    }
+
+    return result;
+}
+
+}; // namespace nova
+
@@ -74,22 +74,23 @@ for trial in trials:
 
     policy, timing = gridWorld.solve(algorithm=trial['algorithm'], process=trial['process'], heuristic=h)
 
-    prettyActions = ["L", "U", "R", "D"]
+    # Note: States without an action in the policy map to index -1, i.e., the blank entry at the end.
+    prettyActions = np.array(["L", "U", "R", "D", " "])
+
+    w = trial['w']
+    h = trial['h']
 
     if policy.r == 0:
-        for y in range(trial['h']):
-            for x in range(trial['w']):
-                print(prettyActions[policy.pi[y * trial['w'] + x]] + " ", end='')
-            print()
+        pi = np.ctypeslib.as_array(policy.pi, shape=(policy.n,))
+        actionGrid = pi[:w * h].astype(int)
     else:
-        S = [policy.S[i] for i in range(policy.r)]
-        for y in range(trial['h']):
-            for x in range(trial['w']):
-                try:
-                    i = S.index(y * trial['w'] + x)
-                    print(prettyActions[policy.pi[i]] + " ", end='')
-                except ValueError:
-                    print("  ", end='')
-            print()
+        # Sort the states once, keeping the first entry for each state, as a linear search would.
+        S, i = np.unique(np.ctypeslib.as_array(policy.S, shape=(policy.r,)), return_index=True)
+        pi = np.ctypeslib.as_array(policy.pi, shape=(policy.r,))[i]
 
+        actionGrid = np.full(w * h, -1, dtype=int)
+        inGrid = S < w * h
+        actionGrid[S[inGrid]] = pi[inGrid]
 
+    for row in np.take(prettyActions, actionGrid).reshape((h, w)):
+        print(" ".join(row) + " ")
@@ -63,47 +63,62 @@ for f in files:
 
     filename = os.path.join(thisFilePath, f['filename'])
 
+    # Load the file once. Each trial restores its original belief points, then expands them, and
+    # every process solves the same expanded POMDP.
+    pomdp = POMDP()
+    pomdp.load(filename, filetype=f['filetype'], cache=True)
+    pomdp.horizon = int(horizon)
+
+    # Store the intial belief from this file.
+    b0 = zeros(pomdp.n)
+    for k in range(pomdp.rz):
+        s = pomdp.Z[0 * pomdp.rz + k]
+        if s < 0:
+            break
+        b0[s] = pomdp.B[0 * pomdp.rz + k]
+
+    # Copy the original belief points, since expanding replaces them.
+    r, rz = pomdp.r, pomdp.rz
+    Z = pomdp.Z[:r * rz]
+    B = pomdp.B[:r * rz]
+
+    print(" - %s " % (", ".join(processes)), end='')
+
+    out = dict()
     for p in processes:
-        print(" - %s " % (p), end='')
-
         fileSuffix = "_".join([f['name'], p])
+        out[p] = open(os.path.join(thisFilePath, "results", fileSuffix) + ".csv", "w")
+        out[p].write("n,m,z,r,ns,rz,time,V(b0)\n")
 
-        with open(os.path.join(thisFilePath, "results", fileSuffix) + ".csv", "w") as out:
-            out.write("n,m,z,r,ns,rz,time,V(b0)\n")
-
-            for j in range(numTrials):
-                print(".", end='')
-                sys.stdout.flush()
+    for j in range(numTrials):
+        print(".", end='')
+        sys.stdout.flush()
 
-                pomdp = POMDP()
-                pomdp.load(filename, filetype=f['filetype'])
-                pomdp.horizon = int(horizon)
+        pomdp.r, pomdp.rz = r, rz
+        pomdp.Z = (ct.c_int * (r * rz))(*Z)
+        pomdp.B = (ct.c_float * (r * rz))(*B)
 
-                # Store the intial belief from this file.
-                b0 = zeros(pomdp.n)
-                for k in range(pomdp.rz):
-                    s = pomdp.Z[0 * pomdp.rz + k]
-                    if s < 0:
-                        break
-                    b0[s] = pomdp.B[0 * pomdp.rz + k]
+        # Do expansions using random exploration. This lets us control the exact number of beliefs for
+        # CPU vs GPU. Note: The number of beliefs is likely to be way too small for random exploration.
+        # This is just to get a sense of the speed, not the optimal value. Also, the horizon is much
+        # too small for the larger domains.
+        pomdp.expand(method='random', numBeliefsToAdd=(pow(2, f['numExpandSteps']) - 1))
 
-                # Do expansions using random exploration. This lets us control the exact number of beliefs for
-                # CPU vs GPU. Note: The number of beliefs is likely to be way too small for random exploration.
-                # This is just to get a sense of the speed, not the optimal value. Also, the horizon is much
-                # too small for the larger domains.
-                pomdp.expand(method='random', numBeliefsToAdd=(pow(2, f['numExpandSteps']) - 1))
+        for p in processes:
+            policy, timing = pomdp.solve(process=p, algorithm=fixedAlgorithm)
 
-                policy, timing = pomdp.solve(process=p, algorithm=fixedAlgorithm)
+            #print(pomdp)
+            #print(policy)
 
-                #print(pomdp)
-                #print(policy)
+            # Compute the value of the initial belief.
+            Vb0, ab0 = policy.value_and_action(b0)
 
-                # Compute the value of the initial belief.
-                Vb0, ab0 = policy.value_and_action(b0)
+            # Note: use the time.time() function, which measures wall-clock time.
+            out[p].write("%i,%i,%i,%i,%i,%i,%.5f,%.5f\n" % (pomdp.n, pomdp.m, pomdp.z, pomdp.r, pomdp.ns, pomdp.rz,
+                                                           timing[0], Vb0))
 
-                # Note: use the time.time() function, which measures wall-clock time.
-                out.write("%i,%i,%i,%i,%i,%i,%.5f,%.5f\n" % (pomdp.n, pomdp.m, pomdp.z, pomdp.r, pomdp.ns, pomdp.rz,
-                                                            timing[0], Vb0))
+    for p in processes:
+        out[p].close()
 
-        print()
+    print()
 
@@ -76,8 +76,9 @@ for f in files:
                 print(".", end='')
                 sys.stdout.flush()
 
+                # Note: After the first trial, this loads the cached '.npz' instead of parsing the file.
                 pomdp = POMDP()
-                pomdp.load(filename, filetype=f['filetype'])
+                pomdp.load(filename, filetype=f['filetype'], cache=True)
                 pomdp.horizon = int(horizon)
 
                 # Store the intial belief from this file.
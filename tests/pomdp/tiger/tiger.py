@@ -22,13 +22,20 @@
 
 import os
 import sys
-import pylab
+
+# Without a display, use a non-interactive backend so the script still runs (e.g., over ssh).
+import matplotlib
+if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+    matplotlib.use("Agg")
+from matplotlib import pyplot
+from matplotlib.collections import LineCollection
 
 thisFilePath = os.path.dirname(os.path.realpath(__file__))
 
 sys.path.append(os.path.join(thisFilePath, "..", "..", "..", "python"))
 from nova.mdp import *
 from nova.pomdp import *
+from nova.numba_kernels import best_action_value
 
 
 files = [
@@ -77,16 +84,26 @@ for f in files:
     policy, timing = tiger.solve(process=f['process'], algorithm=f['algorithm'])
     print(policy)
 
-    pylab.hold(True)
-    pylab.title("Alpha-Vectors for Tiger Problem (Expand: %s)" % (f['expand']))
-    pylab.xlabel("Belief of State s2: b(s2)")
-    pylab.ylabel("Value of Belief: V(b(s2))")
-    for i in range(policy.r):
-        if policy.pi[i] == 0:
-            pylab.plot([0.0, 1.0], [policy.Gamma[i * policy.n + 0], policy.Gamma[i * policy.n + 1]], linewidth=10, color='red')
-        elif policy.pi[i] == 1:
-            pylab.plot([0.0, 1.0], [policy.Gamma[i * policy.n + 0], policy.Gamma[i * policy.n + 1]], linewidth=10, color='green')
-        elif policy.pi[i] == 2:
-            pylab.plot([0.0, 1.0], [policy.Gamma[i * policy.n + 0], policy.Gamma[i * policy.n + 1]], linewidth=10, color='blue')
-    pylab.show()
+    Gamma = np.ctypeslib.as_array(policy.Gamma, shape=(policy.r, policy.n))
+    pi = np.ctypeslib.as_array(policy.pi, shape=(policy.r,))
+
+    figure, axes = pyplot.subplots()
+    axes.set_title("Alpha-Vectors for Tiger Problem (Expand: %s)" % (f['expand']))
+    axes.set_xlabel("Belief of State s2: b(s2)")
+    axes.set_ylabel("Value of Belief: V(b(s2))")
+
+    # Draw all alpha-vectors at once, each a segment from (0, alpha(s1)) to (1, alpha(s2)) colored by its action.
+    segments = np.stack([np.zeros(policy.r), Gamma[:, 0], np.ones(policy.r), Gamma[:, 1]], axis=1).reshape((policy.r, 2, 2))
+    colors = np.take(['red', 'green', 'blue'], pi)
+    axes.add_collection(LineCollection(segments, colors=colors, linewidths=10))
+    axes.autoscale()
+
+    # Overlay the value function itself, i.e., the upper surface of the alpha-vectors.
+    bs2 = np.linspace(0.0, 1.0, 101)
+    B = np.array([1.0 - bs2, bs2]).T.astype(np.float32)
+    Vb, ab = best_action_value(Gamma, pi, B)
+    axes.plot(bs2, Vb, linewidth=2, color='black')
+
+    pyplot.show()
+    pyplot.close(figure)
 
@@ -0,0 +1,164 @@
+""" The MIT License (MIT)
+
+    Copyright (c) 2015 Kyle Hollins Wray, University of Massachusetts
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy of
+    this software and associated documentation files (the "Software"), to deal in
+    the Software without restriction, including without limitation the rights to
+    use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+    the Software, and to permit persons to whom the Software is furnished to do so,
+    subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+    FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+    COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+    IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+    CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+
+import numpy as np
+
+thisFilePath = os.path.dirname(os.path.realpath(__file__))
+
+sys.path.append(os.path.join(thisFilePath, "..", "..", "..", "python"))
+from nova.pomdp import *
+
+
+# The tolerance of each way to evaluate the policy, relative to the largest magnitude in Gamma.
+evaluations = [
+        {'process': 'cpu', 'precision': 'single', 'tolerance': 1e-6},
+        {'process': 'gpu', 'precision': 'single', 'tolerance': 1e-6},
+        {'process': 'gpu', 'precision': 'half', 'tolerance': 1e-3},
+        {'process': 'gpu', 'precision': 'int8', 'tolerance': 2e-2},
+        ]
+
+
+def check_values_and_actions(label, Gamma, pi, B, Vref, V, a, tolerance):
+    """ Check the values and actions of a belief grid against the reference values, within a tolerance.
+
+        Parameters:
+            label       --  The name of the evaluation, used when printing.
+            Gamma       --  The alpha-vectors (r-n array).
+            pi          --  The actions of the alpha-vectors (r array).
+            B           --  The belief grid (k-n array).
+            Vref        --  The reference values from value_and_action (k array).
+            V           --  The values to check (k array).
+            a           --  The actions to check (k array).
+            tolerance   --  The tolerance, relative to the largest magnitude in Gamma.
+    """
+
+    atol = tolerance * max(1.0, np.abs(Gamma).max())
+
+    valueError = np.abs(V - Vref).max()
+
+    # Near ties, any action whose best alpha-vector is within the tolerance of the optimal value is correct.
+    scores = B.dot(Gamma.T)
+    actionError = 0.0
+    for i in range(B.shape[0]):
+        actionError = max(actionError, Vref[i] - scores[i, pi == a[i]].max())
+
+    print("%-12s max value error: %.3e, max action error: %.3e, tolerance: %.3e" % (label, valueError, actionError, atol))
+    assert valueError <= atol and actionError <= atol
+
+
+def model_arrays(pomdp):
+    """ Return the model's variables and arrays, so that two loads can be compared.
+
+        Parameters:
+            pomdp   --  The POMDP object.
+
+        Returns:
+            The list of the model's variables and numpy copies of its arrays.
+    """
+
+    return [pomdp.n, pomdp.ns, pomdp.m, pomdp.z, pomdp.r, pomdp.rz, pomdp.horizon, pomdp.gamma,
+            np.ctypeslib.as_array(pomdp.S, shape=(pomdp.n * pomdp.m * pomdp.ns,)).copy(),
+            np.ctypeslib.as_array(pomdp.T, shape=(pomdp.n * pomdp.m * pomdp.ns,)).copy(),
+            np.ctypeslib.as_array(pomdp.O, shape=(pomdp.m * pomdp.n * pomdp.z,)).copy(),
+            np.ctypeslib.as_array(pomdp.R, shape=(pomdp.n * pomdp.m,)).copy(),
+            np.ctypeslib.as_array(pomdp.Z, shape=(pomdp.r * pomdp.rz,)).copy(),
+            np.ctypeslib.as_array(pomdp.B, shape=(pomdp.r * pomdp.rz,)).copy()]
+
+
+# Loading through the cache, both when it is created and when it is read, must match parsing the file.
+cacheDirectory = tempfile.mkdtemp()
+try:
+    tigerFile = os.path.join(cacheDirectory, "tiger_95.pomdp")
+    shutil.copy(os.path.join(thisFilePath, "tiger_95.pomdp"), tigerFile)
+
+    loads = []
+    for cache in [False, True, True]:
+        tiger = POMDP()
+        tiger.load(tigerFile, filetype="cassandra", cache=cache)
+        loads += [model_arrays(tiger)]
+
+    assert os.path.isfile(tigerFile + ".npz")
+    for load in loads[1:]:
+        assert all(np.array_equal(x, y) for x, y in zip(loads[0], load))
+    print("cache        round trip matches the parsed file")
+finally:
+    shutil.rmtree(cacheDirectory)
+
+tiger = POMDP()
+tiger.load(os.path.join(thisFilePath, "tiger_95.pomdp"), filetype="cassandra")
+for i in range(3):
+    tiger.expand(method="distinct_beliefs")
+
+policy, timing = tiger.solve(process='cpu', algorithm='pbvi')
+print(policy)
+
+Gamma = np.ctypeslib.as_array(policy.Gamma, shape=(policy.r, policy.n)).copy()
+pi = np.ctypeslib.as_array(policy.pi, shape=(policy.r,)).copy()
+
+bs2 = np.linspace(0.0, 1.0, 101)
+B = np.array([1.0 - bs2, bs2]).T.astype(np.float32)
+
+Vref = np.array([policy.value_and_action(b)[0] for b in B], dtype=np.float32)
+
+for e in evaluations:
+    V, a = policy.values_and_actions(B, process=e['process'], precision=e['precision'])
+    check_values_and_actions("%s %s" % (e['process'], e['precision']), Gamma, pi, B, Vref, V, a, e['tolerance'])
+
+# Sorting only reorders the alpha-vectors, so the values are unchanged.
+try:
+    policy.sort(B)
+except Exception:
+    print("sort         skipped since the 'nova' library's GPU is unavailable")
+else:
+    V = np.array([policy.value_and_action(b)[0] for b in B], dtype=np.float32)
+    assert np.allclose(V, Vref, rtol=0.0, atol=1e-6 * max(1.0, np.abs(Gamma).max()))
+    print("sort         values are unchanged")
+
+# The combined belief update and evaluation must match an explicit belief update, then value_and_action.
+S = np.ctypeslib.as_array(tiger.S, shape=(tiger.n, tiger.m, tiger.ns))
+T = np.ctypeslib.as_array(tiger.T, shape=(tiger.n, tiger.m, tiger.ns))
+O = np.ctypeslib.as_array(tiger.O, shape=(tiger.m, tiger.n, tiger.z))
+
+bp = np.empty(tiger.n, dtype=np.float32)
+for b in B[1:-1]:
+    for a in range(tiger.m):
+        for o in range(tiger.z):
+            bpRef = np.zeros(tiger.n)
+            for s in range(tiger.n):
+                for i in range(tiger.ns):
+                    if S[s, a, i] < 0:
+                        break
+                    bpRef[S[s, a, i]] += T[s, a, i] * b[s]
+            bpRef *= O[a, :, o]
+            bpRef /= bpRef.sum()
+
+            VbpRef, apRef = policy.value_and_action(bpRef)
+            bpResult, Vbp, ap = tiger.value_and_action_after_update(policy, b, a, o, bp=bp)
+
+            assert bpResult is bp and np.allclose(bp, bpRef, atol=1e-6)
+            assert abs(Vbp - VbpRef) <= 1e-5 * max(1.0, abs(VbpRef)) and ap == apRef
+print("update       matches an explicit belief update")